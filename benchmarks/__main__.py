@@ -0,0 +1,81 @@
+import argparse
+import os
+import sys
+
+from .harness import measure, save_results, load_results, compare, \
+    print_report
+
+
+def main(argv=None):
+    """Точка входа замеров производительности."""
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description="Замеры производительности горячих участков Food Rush.")
+    parser.add_argument('--only', action='append', default=[],
+                        metavar='NAME',
+                        help="запустить только сценарии с этим именем")
+    parser.add_argument('--iterations', type=int, default=300,
+                        help="число замеров на сценарий")
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--quick', action='store_true',
+                        help="в 10 раз меньше замеров для быстрой проверки")
+    parser.add_argument('--json', dest='json_path', default=None,
+                        help="сохранить результаты в JSON-файл")
+    parser.add_argument('--baseline', default=None, metavar='PATH',
+                        help="сравнить с сохраненными результатами")
+    parser.add_argument('--tolerance', type=float, default=0.15,
+                        help="допустимый рост медианы относительно базы")
+    args = parser.parse_args(argv)
+
+    # Замеры идут без окна и звука
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+    import pygame
+    from headless import create_game_manager
+    from game.services.progress_manager import ProgressManager
+    from .scenarios import SCENARIOS, DEFAULT_PLAN, plan_name
+
+    unknown = set(args.only) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"неизвестные сценарии: {', '.join(sorted(unknown))}")
+
+    iterations = args.iterations
+    warmup = args.warmup
+    if args.quick:
+        iterations = max(10, iterations // 10)
+        warmup = max(2, warmup // 10)
+
+    def run(operation, prepare=None):
+        return measure(operation, iterations, warmup, prepare)
+
+    game_manager = create_game_manager(ProgressManager(persistent=False),
+                                       seed=0)
+    results = {}
+    for name, params in DEFAULT_PLAN:
+        if args.only and name not in args.only:
+            continue
+        results[plan_name(name, params)] = SCENARIOS[name](
+            game_manager, run, **params)
+    pygame.quit()
+
+    comparison = None
+    if args.baseline:
+        comparison = compare(results, load_results(args.baseline),
+                             args.tolerance)
+    print_report(results, comparison)
+
+    if args.json_path:
+        save_results(args.json_path, results)
+
+    regressions = [name for name, _, regressed in comparison or []
+                   if regressed]
+    if regressions:
+        print(f"Регрессий: {len(regressions)} "
+              f"(допуск {args.tolerance:.0%})")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,104 @@
+import json
+import platform
+import time
+
+
+def _percentile(sorted_samples, percent):
+    """Перцентиль по отсортированной выборке (ближайший ранг)."""
+    index = int(round(percent / 100 * (len(sorted_samples) - 1)))
+    return sorted_samples[index]
+
+
+def measure(operation, iterations, warmup=10, prepare=None):
+    """
+    Замеряет время одной операции iterations раз после прогрева.
+    prepare вызывается перед каждым замером и в время не входит.
+    Возвращает число операций в секунду и перцентили задержки в мс.
+    """
+    for _ in range(warmup):
+        if prepare is not None:
+            prepare()
+        operation()
+
+    samples = []
+    perf_counter = time.perf_counter
+    for _ in range(iterations):
+        if prepare is not None:
+            prepare()
+        start = perf_counter()
+        operation()
+        samples.append(perf_counter() - start)
+
+    samples.sort()
+    total = sum(samples)
+    return {
+        'iterations': iterations,
+        'ops_per_sec': round(iterations / total, 1) if total else None,
+        'mean_ms': round(total / iterations * 1000, 4),
+        'p50_ms': round(_percentile(samples, 50) * 1000, 4),
+        'p90_ms': round(_percentile(samples, 90) * 1000, 4),
+        'p99_ms': round(_percentile(samples, 99) * 1000, 4),
+        'max_ms': round(samples[-1] * 1000, 4),
+    }
+
+
+def environment():
+    """Сведения об окружении для сравнения результатов между машинами."""
+    import pygame
+    return {
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+    }
+
+
+def save_results(path, results):
+    """Сохраняет результаты замеров в JSON-файл."""
+    with open(path, 'w') as f:
+        json.dump({'environment': environment(), 'results': results}, f,
+                  indent=4, ensure_ascii=False)
+
+
+def load_results(path):
+    """Загружает результаты замеров, сохраненные save_results."""
+    with open(path, 'r') as f:
+        return json.load(f)['results']
+
+
+def compare(results, baseline, tolerance):
+    """
+    Сравнивает медианы задержки с базовыми результатами.
+    Возвращает список (сценарий, отношение, регрессия ли это);
+    регрессия - медиана выросла больше чем на tolerance.
+    """
+    comparison = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base or not base.get('p50_ms'):
+            continue
+        ratio = result['p50_ms'] / base['p50_ms']
+        comparison.append((name, ratio, ratio > 1 + tolerance))
+    return comparison
+
+
+def print_report(results, comparison=None):
+    """Печатает таблицу результатов и сравнения с базовыми."""
+    ratios = {name: (ratio, regressed)
+              for name, ratio, regressed in comparison or []}
+    header = (f"{'Сценарий':<34} {'оп/с':>10} {'p50, мс':>9} "
+              f"{'p90, мс':>9} {'p99, мс':>9}")
+    if comparison is not None:
+        header += f" {'к базе':>9}"
+    print(header)
+    print('-' * len(header))
+    for name, result in results.items():
+        line = (f"{name:<34} {result['ops_per_sec']:>10} "
+                f"{result['p50_ms']:>9.3f} {result['p90_ms']:>9.3f} "
+                f"{result['p99_ms']:>9.3f}")
+        if name in ratios:
+            ratio, regressed = ratios[name]
+            line += f" {ratio:>8.2f}x"
+            if regressed:
+                line += "  РЕГРЕССИЯ"
+        print(line)
@@ -0,0 +1,219 @@
+import os
+import random
+import tempfile
+import time
+
+import pygame
+from game import constants as C
+from game.models.obstacles import OncomingCar, Manhole
+from game.services.progress_manager import ProgressManager
+from game.views.minigame.maze_generator import MazeGenerator, AStarPathfinder
+
+
+SCENARIOS = {}
+
+
+def scenario(name):
+    """Регистрирует сценарий замера под именем name."""
+    def register(function):
+        SCENARIOS[name] = function
+        return function
+    return register
+
+
+def _start_run(game_manager, route_type='short'):
+    """Запускает заезд с фиксированным зерном."""
+    order_manager = game_manager.order_manager
+    order_manager.select_order(0)
+    order_manager.select_route(route_type)
+    game_manager.start_new_game(seed=0)
+
+
+def _place_obstacles(road, count, rng):
+    """Расставляет count препятствий по экрану без проверки интервалов."""
+    for obstacle in road.obstacles.sprites():
+        obstacle.release()
+    for _ in range(count):
+        cls = OncomingCar if rng.random() < C.CAR_SPAWN_CHANCE else Manhole
+        obstacle = road.obstacle_pool.acquire(
+            cls, rng.choice(road.lane_centers), rng)
+        obstacle.y = obstacle.prev_y = rng.uniform(0, C.WINDOW_HEIGHT)
+        obstacle.rect.y = round(obstacle.y)
+        road.obstacles.add(obstacle)
+    road.lane_index.rebuild(road.obstacles)
+
+
+@scenario('road_update')
+def road_update(game_manager, run, decorations):
+    """Шаг Road.update при decorations камнях на газоне."""
+    _start_run(game_manager)
+    road = game_manager.road
+    speed = C.PLAYER_BASE_SPEED
+
+    def top_up():
+        # Ушедшие за экран камни заменяются новыми над экраном,
+        # чтобы в хранилище все время было около decorations камней
+        missing = decorations - len(road.decorations)
+        if missing > 0:
+            road._spawn_decorations(sorted(
+                (road.rng.decorations.uniform(-C.WINDOW_HEIGHT, 0)
+                 for _ in range(missing)), reverse=True))
+
+    return run(lambda: road.update(C.SIMULATION_DT, speed),
+               prepare=top_up)
+
+
+@scenario('obstacle_burst')
+def obstacle_burst(game_manager, run, burst):
+    """Появление и возврат в пул пачки из burst препятствий."""
+    _start_run(game_manager)
+    road = game_manager.road
+    rng = random.Random(0)
+
+    def spawn_burst():
+        for _ in range(burst):
+            cls = OncomingCar if rng.random() < 0.5 else Manhole
+            road.obstacles.add(road.obstacle_pool.acquire(
+                cls, rng.choice(road.lane_centers), rng))
+        for obstacle in road.obstacles.sprites():
+            obstacle.release()
+
+    return run(spawn_burst)
+
+
+@scenario('collisions')
+def collisions(game_manager, run, obstacles):
+    """Проверка столкновений игрока с obstacles препятствиями."""
+    _start_run(game_manager)
+    road = game_manager.road
+    player = game_manager.player
+    _place_obstacles(road, obstacles, random.Random(0))
+
+    def check():
+        for obstacle in road.get_collision_candidates(player.rect):
+            pygame.sprite.collide_mask(player, obstacle)
+
+    return run(check)
+
+
+@scenario('frame_draw')
+def frame_draw(game_manager, run):
+    """Кадр игры: Road.draw, игрок и HUDView.draw."""
+    _start_run(game_manager)
+    road = game_manager.road
+    player = game_manager.player
+    screen = game_manager.screen
+
+    def step():
+        # Дорога едет, чтобы фон иногда дорисовывал новые куски
+        road.update(C.SIMULATION_DT, C.PLAYER_BASE_SPEED)
+
+    def draw():
+        road.draw(screen, 0.5)
+        screen.blit(player.image, player.interpolated_topleft(0.5))
+        game_manager.hud_view.draw(
+            screen, player,
+            game_manager.current_order_distance - road.distance_traveled,
+            game_manager.current_order_reward,
+            game_manager.progress_manager.coins)
+
+    return run(draw, prepare=step)
+
+
+@scenario('maze_generate')
+def maze_generate(game_manager, run, size, algorithm='backtracker'):
+    """Генерация лабиринта size x size алгоритмом algorithm."""
+    rng = random.Random(0)
+    return run(lambda: MazeGenerator(size, size, rng, algorithm).generate())
+
+
+@scenario('maze_astar')
+def maze_astar(game_manager, run, size, mode='astar'):
+    """Поиск пути через лабиринт size x size от входа до выхода."""
+    generator = MazeGenerator(size, size, random.Random(0))
+    maze = generator.generate()
+    pathfinder = AStarPathfinder(maze)
+    start = (1, 0)
+    end = (generator.rows - 2, generator.cols - 1)
+    return run(lambda: pathfinder.find_path(start, end, mode))
+
+
+@scenario('revive_start')
+def revive_start(game_manager, run, size):
+    """MinigameView.start с лабиринтом size x size, готовым в пуле."""
+    rows, cols = C.MINIGAME_ROWS, C.MINIGAME_COLS
+    C.MINIGAME_ROWS = C.MINIGAME_COLS = size
+    view = game_manager.minigame_view
+
+    def prepare():
+        view.prepare()
+        while not view.pool.ready(view.next_seed):
+            time.sleep(0.001)
+
+    try:
+        return run(view.start, prepare=prepare)
+    finally:
+        C.MINIGAME_ROWS, C.MINIGAME_COLS = rows, cols
+
+
+@scenario('progress_save')
+def progress_save(game_manager, run):
+    """Запрос сохранения прогресса из игрового потока."""
+    with tempfile.TemporaryDirectory() as saves_dir:
+        progress_manager = ProgressManager(
+            filepath=os.path.join(saves_dir, C.PROGRESS_FILE))
+        progress_manager.vehicles = {key: True for key in C.VEHICLES}
+        try:
+            return run(progress_manager.save)
+        finally:
+            progress_manager.close()
+
+
+@scenario('progress_write')
+def progress_write(game_manager, run):
+    """Атомарная запись файла прогресса фоновым потоком."""
+    with tempfile.TemporaryDirectory() as saves_dir:
+        progress_manager = ProgressManager(
+            persistent=False,
+            filepath=os.path.join(saves_dir, C.PROGRESS_FILE))
+        progress_manager.vehicles = {key: True for key in C.VEHICLES}
+        snapshot = progress_manager.snapshot()
+        return run(lambda: progress_manager._write(snapshot))
+
+
+# Сценарии и параметры полного прогона
+DEFAULT_PLAN = [
+    ('road_update', {'decorations': 100}),
+    ('road_update', {'decorations': 1000}),
+    ('road_update', {'decorations': 10000}),
+    ('obstacle_burst', {'burst': 10}),
+    ('obstacle_burst', {'burst': 100}),
+    ('collisions', {'obstacles': 10}),
+    ('collisions', {'obstacles': 100}),
+    ('collisions', {'obstacles': 1000}),
+    ('frame_draw', {}),
+    ('maze_generate', {'size': 15}),
+    ('maze_generate', {'size': 51}),
+    ('maze_generate', {'size': 101}),
+    ('maze_generate', {'size': 201}),
+    ('maze_generate', {'size': 201, 'algorithm': 'eller'}),
+    ('maze_generate', {'size': 201, 'algorithm': 'wilson'}),
+    ('maze_astar', {'size': 15}),
+    ('maze_astar', {'size': 51}),
+    ('maze_astar', {'size': 101}),
+    ('maze_astar', {'size': 501}),
+    ('maze_astar', {'size': 501, 'mode': 'bfs'}),
+    ('maze_astar', {'size': 501, 'mode': 'bidirectional'}),
+    ('revive_start', {'size': 15}),
+    ('revive_start', {'size': 501}),
+    ('progress_save', {}),
+    ('progress_write', {}),
+]
+
+
+def plan_name(name, params):
+    """Имя замера вида road_update[decorations=1000]."""
+    if not params:
+        return name
+    args = ','.join(f"{key}={value}" for key, value in params.items())
+    return f"{name}[{args}]"
@@ -4,6 +4,16 @@ WINDOW_HEIGHT = 720
 GAME_TITLE = "Food Rush"
 FPS = 60
 
+# Симуляция идет фиксированными шагами, независимо от частоты кадров.
+# FPS ограничивает только отрисовку (0 - без ограничения).
+SIMULATION_RATE = 120
+SIMULATION_DT = 1.0 / SIMULATION_RATE
+# Максимальное время кадра, которое симуляция догоняет за один кадр
+SIMULATION_MAX_FRAME_TIME = 0.1
+# Статичные экраны (меню, пауза, лабиринт) обновляют на дисплее только
+# изменившиеся области вместо всего кадра
+DIRTY_RECTS = True
+
 # Состояния игры
 
 
@@ -48,11 +58,18 @@ FONT_SIZE_TITLE = 74
 FONT_SIZE_LARGE = 48
 FONT_SIZE_MEDIUM = 36
 FONT_SIZE_SMALL = 28
+FONT_SIZE_PROFILER = 20
+# Сколько отрендеренных строк текста хранить в кэше
+TEXT_CACHE_SIZE = 256
 
 # Путь к ресурсам
 ASSETS_DIR = 'assets'
 SAVES_DIR = 'saves'
 PROGRESS_FILE = 'progress.json'
+HISTORY_FILE = 'history.db'
+# Задержка фоновой записи прогресса: изменения за это время
+# записываются одним разом
+PROGRESS_SAVE_DELAY = 0.5
 
 # Спрайты и звуки
 IMG_BACKGROUND = 'background.png'
@@ -63,9 +80,13 @@ SND_MOVE = 'move.wav'
 SND_COLLISION = 'collision.wav'
 SND_ORDER_FAILED = 'order_failed.wav'
 SND_ORDER_COMPLETED = 'order_completed.wav'
+SND_CLICK = 'click.wav'
 MSC_MENU = 'menu_music.mp3'
 MSC_GAME = 'game_music.mp3'
 
+# Потоки декодирования ресурсов при запуске (0 - по числу ядер)
+ASSET_PRELOAD_WORKERS = 0
+
 # Кадры для анимации успешной доставки
 IMG_DELIVERY_PLAYER_FRAMES = ['player2.png', 'player3.png']
 DELIVERY_PLAYER_SIZE = (80, 80)
@@ -89,10 +110,13 @@ LANE_3_POS_RATIO = 0.835
 ROAD_LINE_WIDTH = 10
 ROAD_LINE_LENGTH = 70
 ROAD_LINE_GAP = 50
+ROAD_BACKGROUND_CHUNK_HEIGHT = WINDOW_HEIGHT
 
 # Настройки препятствий
 OBSTACLE_SPAWN_RATE = 1.2
 CAR_SPAWN_CHANCE = 0.7
+OBSTACLE_MIN_SPACING = 200
+OBSTACLE_POOL_PREFILL = 8
 CAR_WIDTH = 80
 CAR_HEIGHT = 150
 MANHOLE_SIZE = 100
@@ -100,6 +124,7 @@ MANHOLE_OPEN_Y_THRESHOLD_RATIO = 0.4
 MANHOLE_TRANSITION_SPEED = 2.5
 MANHOLE_OPEN_OFFSET_MULTIPLIER = 0.3
 MANHOLE_DIAGONAL_OFFSET_FACTOR = 0.1
+MANHOLE_ANIMATION_FRAMES = 24
 
 # Настройки анимации успешной доставки
 DELIVERY_ANIMATION_DURATION = 3.5
@@ -109,7 +134,36 @@ DELIVERY_ANIMATION_FRAME_DURATION = 0.1
 MINIGAME_ROWS = 15
 MINIGAME_COLS = 20
 MINIGAME_CELL_SIZE = 30
+# Верхняя граница лабиринта под заголовком и отступ от краев окна
+MINIGAME_MAZE_TOP = 120
+MINIGAME_MAZE_MARGIN = 20
 MINIGAME_MOVE_DELAY = 0.15
+# Алгоритм генерации: 'backtracker', 'eller' или 'wilson'
+MINIGAME_MAZE_ALGORITHM = 'backtracker'
+# Сколько готовых лабиринтов хранит фоновый пул
+MINIGAME_POOL_SIZE = 2
+# Клавиша, показывающая путь к выходу
+MINIGAME_HINT_KEY = 'h'
+
+# Профилирование основного цикла
+PROFILER_TOGGLE_KEY = 'f3'
+PROFILER_HISTORY = 240
+PROFILER_OVERLAY_REFRESH = 15
+PROFILER_SECTIONS = (
+    'events',
+    'update',
+    'update.player',
+    'update.road',
+    'update.spawning',
+    'update.collisions',
+    'draw',
+    'draw.road',
+    'draw.obstacles',
+    'draw.hud',
+    'draw.overlays',
+    'flip',
+    'frame',
+)
 
 # Настройки Магазина и Транспорта
 VEHICLES = {
@@ -121,10 +175,17 @@ VEHICLES = {
                    'lives': 5, 'price': 2000}
 }
 
+# Множители дистанции и награды для маршрутов
+ROUTE_PARAMETERS = {
+    'short': {'distance_multiplier': 0.7, 'reward_multiplier': 2.0},
+    'long': {'distance_multiplier': 1.5, 'reward_multiplier': 1.0}
+}
+
 # Настройки декораций на газоне
 DECORATION_SPAWN_CHANCE_PER_FRAME = 0.15
 DECORATION_MIN_Y_SPAWN = -200
 DECORATION_INITIAL_SPAWN_INTERVAL = 40
+DECORATION_LOOKAHEAD = 2 * WINDOW_HEIGHT
 
 # Определение типов декораций
 DECORATION_TYPES = {
@@ -135,6 +196,7 @@ DECORATION_TYPES = {
 SMALL_STONE_COLORS = [(70, 70, 70), (90, 90, 90), (110, 110, 110)]
 SMALL_STONE_SIZE_RANGE = (10, 25)
 SMALL_STONE_ASPECT_RATIO_VARIATION = (0.7, 1.3)
+SMALL_STONE_SHADOW_OFFSET_RANGE = (1, 3)
 
 # Границы для появления декораций на газоне
 DECORATION_SIDE_MARGIN_PERCENT = 0.02
@@ -1,9 +1,14 @@
+import random
 import pygame
 from game import constants as C
 from .services.progress_manager import ProgressManager
 from .services.asset_loader import AssetLoader
+from .services.rng import RandomStreams
+from .services.profiler import Profiler
+from .services.run_history import RunHistory
 from .models.player import Player
 from .models.road import Road
+from .models.obstacles import OncomingCar, Manhole
 from .models.order import OrderManager
 from .views.menu_view import MenuView
 from .views.hud_view import HUDView
@@ -14,15 +19,38 @@ from .views.minigame.minigame_view import MinigameView
 class GameManager:
     """Управляет общим состоянием игры."""
 
-    def __init__(self, screen, clock):
+    # Состояния, в которых кадр меняется только от ввода
+    STATIC_STATES = (C.GameState.MENU, C.GameState.GAME_OVER_SCREEN,
+                     C.GameState.PAUSED, C.GameState.REVIVE_MINIGAME)
+
+    def __init__(self, screen, clock, progress_manager=None, seed=None,
+                 run_history=None):
         self.screen = screen
         self.clock = clock
         self.running = True
         self.game_state = C.GameState.MENU
 
+        # Номер шага симуляции
+        self.tick = 0
+        # Запись ввода или воспроизведение записи
+        self.recorder = None
+        self.replay = None
+
+        # Зерна заездов берутся из последовательности, заданной seed,
+        # поэтому одинаковый seed дает одинаковую серию заездов
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        self.seed_sequence = random.Random(seed)
+        self.run_seed = None
+        self.rng = RandomStreams(self.seed_sequence.randrange(2 ** 32))
+
         # Инициализация сервисов
-        self.progress_manager = ProgressManager()
-        self.order_manager = OrderManager()
+        self.progress_manager = progress_manager or ProgressManager()
+        # История пишется на диск, только если туда пишется прогресс
+        self.run_history = run_history or RunHistory(
+            persistent=self.progress_manager.persistent)
+        self.order_manager = OrderManager(self.rng)
 
         road_width = C.WINDOW_WIDTH * C.ROAD_WIDTH_RATIO
         road_left = (C.WINDOW_WIDTH - road_width) / 2
@@ -33,80 +61,183 @@ class GameManager:
         ]
 
         # Инициализация моделей
+        OncomingCar.preload_sprites()
+        Manhole.get_frames()
         self.player = Player(self.lane_centers)
-        self.road = Road(self.lane_centers, None)
+        self.road = Road(self.lane_centers, None, self.rng)
 
         # Инициализация представлений
-        self.menu_view = MenuView(self.progress_manager, self.order_manager)
+        self.menu_view = MenuView(self.progress_manager, self.order_manager,
+                                  self.run_history)
         self.hud_view = HUDView()
         self.animation_view = DeliveryAnimationView()
-        self.minigame_view = MinigameView()
+        self.minigame_view = MinigameView(self.rng)
 
         self.current_order_distance = 0
         self.current_order_reward = 0
 
         self.revive_available = True
 
+        # Итоги текущего заезда для истории; пока заезда нет,
+        # записывать нечего
+        self.run_time = 0.0
+        self.run_collisions = 0
+        self.run_recorded = True
+        # Заказ, маршрут и транспорт запоминаются при старте: к записи
+        # брошенного заезда в меню уже может быть выбран другой заказ
+        self.run_order_name = None
+        self.run_route = None
+        self.run_vehicle = None
+
+        # Состояние, нарисованное в прошлом кадре, и запрос полной
+        # перерисовки статичного экрана (например, после перекрытия окна)
+        self._drawn_state = None
+        self.full_redraw = True
+
+        # Кадр паузы: последний кадр заезда с затемнением и надписью,
+        # собирается один раз при входе в паузу
+        self.pause_frame = None
+        self.pause_overlay = None
+        self.pause_frame_stale = True
+
         AssetLoader.play_music(C.MSC_MENU)
 
     def run(self):
-        """Основной игровой цикл."""
+        """
+        Основной игровой цикл. Симуляция обновляется фиксированными
+        шагами SIMULATION_DT, а отрисовка интерполирует позиции между
+        двумя последними шагами. На паузе цикл спит до следующего события.
+        """
+        accumulator = 0.0
         while self.running:
-            dt = self.clock.tick(C.FPS) / 1000.0
-
-            self.handle_events()
-            self.update(dt)
-            self.draw(self.screen)
-
-            pygame.display.flip()
+            frame_time = self.clock.tick(C.FPS) / 1000.0
+            events = None
+            if self.is_frozen():
+                # Кадр паузы уже на экране: кадры не рисуются до ввода,
+                # а время ожидания не попадает в симуляцию
+                events = [pygame.event.wait()]
+                self.clock.tick()
+                frame_time = 0.0
+            # Ограничение догоняющих шагов после долгого кадра
+            accumulator += min(frame_time, C.SIMULATION_MAX_FRAME_TIME)
+
+            Profiler.begin_frame()
+            with Profiler.section('events'):
+                self.handle_events(events)
+
+            with Profiler.section('update'):
+                while accumulator >= C.SIMULATION_DT and self.running:
+                    if self.replay:
+                        self.feed_replay()
+                    self.update(C.SIMULATION_DT)
+                    accumulator -= C.SIMULATION_DT
+
+            with Profiler.section('draw'):
+                dirty = self.draw(self.screen, accumulator / C.SIMULATION_DT)
+                with Profiler.section('draw.overlays'):
+                    Profiler.draw_overlay(self.screen)
+
+            with Profiler.section('flip'):
+                if dirty is None:
+                    pygame.display.flip()
+                elif dirty:
+                    pygame.display.update(dirty)
+            Profiler.end_frame()
+
+    def is_frozen(self):
+        """Стоит ли игра на паузе с уже показанным кадром паузы."""
+        return (self.game_state == C.GameState.PAUSED and
+                self._drawn_state == C.GameState.PAUSED and
+                not self.full_redraw and not Profiler.overlay_visible and
+                not self.replay)
+
+    def handle_events(self, events=None):
+        """
+        Обрабатывает события игры. events - уже полученные из очереди
+        события, которые обрабатываются перед остальными.
+        """
+        for event in (events or []) + pygame.event.get():
+            if (event.type == pygame.KEYDOWN and
+                    event.key == pygame.key.key_code(C.PROFILER_TOGGLE_KEY)):
+                Profiler.toggle_overlay()
+                self.full_redraw = True
+                continue
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.full_redraw = True
+
+            if self.replay:
+                # При воспроизведении ввод берется из записи
+                if event.type == pygame.QUIT:
+                    self.running = False
+                continue
+
+            if self.recorder:
+                self.recorder.record(self.tick, event,
+                                     Player.read_held_keys())
+            self.handle_event(event)
+
+    def feed_replay(self):
+        """Передает игре события записи для текущего шага симуляции."""
+        for event, held in self.replay.events_for_tick(self.tick):
+            self.handle_event(event, held)
+        if self.replay.finished:
+            self.running = False
+
+    def handle_event(self, event, held=None):
+        """
+        Обрабатывает одно событие. held - зажатые клавиши игрока
+        при воспроизведении записи.
+        """
+        if event.type == pygame.QUIT:
+            self.running = False
+
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            if self.game_state == C.GameState.PLAYING:
+                self.game_state = C.GameState.PAUSED
+                self.pause_frame_stale = True
+            elif self.game_state == C.GameState.PAUSED:
+                self.game_state = C.GameState.PLAYING
 
-    def handle_events(self):
-        """Обрабатывает события игры."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        if self.game_state == C.GameState.MENU:
+            action = self.menu_view.handle_event(event)
+            if action == 'quit':
                 self.running = False
+            elif action == 'start_game':
+                self.start_new_game()
 
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                if self.game_state == C.GameState.PLAYING:
-                    self.game_state = C.GameState.PAUSED
-                elif self.game_state == C.GameState.PAUSED:
-                    self.game_state = C.GameState.PLAYING
+        elif self.game_state == C.GameState.PLAYING:
+            self.player.handle_input(event, held)
 
-            if self.game_state == C.GameState.MENU:
-                action = self.menu_view.handle_event(event)
-                if action == 'quit':
-                    self.running = False
-                elif action == 'start_game':
-                    self.start_new_game()
-
-            elif self.game_state == C.GameState.PLAYING:
-                self.player.handle_input(event)
-
-            elif self.game_state == C.GameState.REVIVE_MINIGAME:
-                result = self.minigame_view.handle_event(event)
-                if result == 'win':
-                    self.player.revive()
-                    self.game_state = C.GameState.PLAYING
-                    AssetLoader.play_music(C.MSC_GAME)
-                elif result == 'lose':
-                    self.end_game(success=False)
+        elif self.game_state == C.GameState.REVIVE_MINIGAME:
+            result = self.minigame_view.handle_event(event)
+            if result == 'win':
+                self.player.revive()
+                self.game_state = C.GameState.PLAYING
+                AssetLoader.play_music(C.MSC_GAME)
+            elif result == 'lose':
+                self.end_game(success=False)
 
-            elif self.game_state == C.GameState.GAME_OVER_SCREEN:
-                action = self.menu_view.handle_event(event)
-                if action == 'start_minigame':
-                    self.revive_available = False
-                    self.minigame_view.start()
-                    self.game_state = C.GameState.REVIVE_MINIGAME
-                elif action == 'go_to_main':
-                    self.game_state = C.GameState.MENU
-                    self.menu_view._set_state('main')
+        elif self.game_state == C.GameState.GAME_OVER_SCREEN:
+            action = self.menu_view.handle_event(event)
+            if action == 'start_minigame':
+                self.revive_available = False
+                self.minigame_view.start()
+                self.game_state = C.GameState.REVIVE_MINIGAME
+            elif action == 'go_to_main':
+                self.finish_run('failed')
+                self.game_state = C.GameState.MENU
+                self.menu_view._set_state('main')
 
     def update(self, dt):
         """Обновление логики игры в зависимости от состояния."""
+        self.tick += 1
         if self.game_state == C.GameState.PLAYING:
-            self.player.update(dt)
+            self.run_time += dt
+            with Profiler.section('update.player'):
+                self.player.update(dt)
             self.road.update(dt, self.player.speed)
-            self._check_collisions()
+            with Profiler.section('update.collisions'):
+                self._check_collisions()
 
             if self.road.distance_traveled >= self.current_order_distance:
                 self.end_game(success=True)
@@ -122,13 +253,14 @@ class GameManager:
 
     def _check_collisions(self):
         """Проверяет столкновения игрока с препятствиями."""
-        collided_obstacle = pygame.sprite.spritecollideany(
-            self.player, self.road.obstacles, pygame.sprite.collide_mask)
-        if collided_obstacle:
-            if hasattr(collided_obstacle, 'is_open') and \
-               not collided_obstacle.is_open:
-                return
+        collided_obstacle = None
+        for obstacle in self.road.get_collision_candidates(self.player.rect):
+            if pygame.sprite.collide_mask(self.player, obstacle):
+                collided_obstacle = obstacle
+                break
 
+        if collided_obstacle:
+            self.run_collisions += 1
             self.road.remove_obstacle(collided_obstacle)
             if not self.player.take_damage():
                 AssetLoader.play_sound(C.SND_COLLISION)
@@ -141,41 +273,69 @@ class GameManager:
                 else:
                     self.end_game(success=False)
 
-    def draw(self, screen):
-        """Отрисовка всего на экране."""
-        self.screen.fill(C.COLOR_GREEN_GRASS)
-
-        if self.game_state == C.GameState.MENU:
-            self.menu_view.draw(self.screen)
-
-        elif self.game_state in [C.GameState.PLAYING, C.GameState.PAUSED]:
-            self.road.draw(self.screen)
-            self.screen.blit(self.player.image, self.player.rect)
-            self.hud_view.draw(self.screen, self.player,
-                               self.current_order_distance -
-                               self.road.distance_traveled,
-                               self.current_order_reward,
-                               self.progress_manager.coins)
-            if self.game_state == C.GameState.PAUSED:
-                self._draw_pause_overlay()
-
-        elif self.game_state == C.GameState.REVIVE_MINIGAME:
-            self.minigame_view.draw(self.screen)
-
-        elif self.game_state == C.GameState.DELIVERY_ANIMATION:
+    def draw(self, screen, alpha=1.0):
+        """
+        Отрисовка всего на экране.
+        alpha - доля шага симуляции для интерполяции позиций.
+        Возвращает список изменившихся областей экрана
+        или None, если изменился весь кадр.
+        """
+        state = self.game_state
+        # Статичный экран рисуется целиком при входе в состояние,
+        # а дальше только в изменившихся областях
+        full = (not C.DIRTY_RECTS or state not in self.STATIC_STATES or
+                state != self._drawn_state or self.full_redraw or
+                Profiler.overlay_visible)
+        self._drawn_state = state
+        self.full_redraw = False
+
+        # Во время заезда экран целиком перекрывается фоном дороги
+        if full and state not in [C.GameState.PLAYING, C.GameState.PAUSED]:
+            self.screen.fill(C.COLOR_GREEN_GRASS)
+
+        dirty = []
+        if state in [C.GameState.MENU, C.GameState.GAME_OVER_SCREEN]:
+            dirty = self.menu_view.draw(self.screen, full)
+
+        elif state == C.GameState.PLAYING:
+            self._draw_gameplay(alpha)
+
+        elif state == C.GameState.PAUSED and full:
+            with Profiler.section('draw.overlays'):
+                self._draw_pause_frame()
+
+        elif state == C.GameState.REVIVE_MINIGAME:
+            dirty = self.minigame_view.draw(self.screen, full)
+
+        elif state == C.GameState.DELIVERY_ANIMATION:
             self.animation_view.draw(self.screen)
 
-        elif self.game_state == C.GameState.GAME_OVER_SCREEN:
-            self.menu_view.draw(self.screen)
+        return None if full else dirty
 
-    def start_new_game(self):
-        """Создание нового заезда."""
-        self.revive_available = True
+    def start_new_game(self, seed=None):
+        """
+        Создание нового заезда. Все случайные потоки заезда
+        пересоздаются от зерна seed (или следующего из последовательности).
+        """
+        self.abandon_run()
         params = self.order_manager.get_final_parameters()
         if not params or params[0] is None:
             self.game_state = C.GameState.MENU
             return
         self.current_order_distance, self.current_order_reward = params
+        self.revive_available = True
+        self.run_time = 0.0
+        self.run_collisions = 0
+        self.run_recorded = False
+        self.run_order_name = self.order_manager.selected_order.name
+        self.run_route = self.order_manager.selected_route_type
+        self.run_vehicle = self.progress_manager.current_vehicle
+
+        self.run_seed = (seed if seed is not None else
+                         self.seed_sequence.randrange(2 ** 32))
+        self.rng.reseed(self.run_seed)
+        # Лабиринт возрождения строится в фоне, пока идет заезд
+        self.minigame_view.prepare()
 
         self.road.reset(self.order_manager.selected_route_type)
         self.player.reset_stats(self.progress_manager.
@@ -186,6 +346,7 @@ class GameManager:
 
     def end_game(self, success):
         """Завершает игру, обрабатывая результат."""
+        self.finish_run('delivered' if success else 'failed')
         if success:
             self.progress_manager.add_coins(self.current_order_reward)
             AssetLoader.play_sound(C.SND_ORDER_COMPLETED)
@@ -197,15 +358,72 @@ class GameManager:
             self.menu_view._set_state('game_over', revive_available=False)
             AssetLoader.play_music(C.MSC_MENU)
 
-    def _draw_pause_overlay(self):
-        """Отрисовка затемнения во время паузы."""
-        overlay = pygame.Surface((C.WINDOW_WIDTH, C.WINDOW_HEIGHT),
-                                 pygame.SRCALPHA)
-        overlay.fill(C.PAUSE_OVERLAY_COLOR)
-        self.screen.blit(overlay, (0, 0))
+    def abandon_run(self):
+        """
+        Записывает начатый, но не завершенный заезд (закрытие окна,
+        переход к новому заезду) с исходом 'abandoned'.
+        """
+        self.finish_run('abandoned')
+
+    def finish_run(self, outcome):
+        """
+        Сохраняет итог заезда в историю, один раз за заезд. outcome -
+        'delivered', 'failed' или 'abandoned'.
+        """
+        if self.run_recorded:
+            return
+        self.run_recorded = True
+        self.run_history.record(
+            order_name=self.run_order_name,
+            route=self.run_route,
+            vehicle=self.run_vehicle,
+            outcome=outcome,
+            distance=int(self.road.distance_traveled),
+            target_distance=self.current_order_distance,
+            reward=self.current_order_reward if outcome == 'delivered' else 0,
+            collisions=self.run_collisions,
+            duration=round(self.run_time, 3),
+            revive_used=not self.revive_available,
+            seed=self.run_seed)
+
+    def _draw_gameplay(self, alpha):
+        """Отрисовка дороги, игрока и HUD."""
+        self.road.draw(self.screen, alpha)
+        self.screen.blit(self.player.image,
+                         self.player.interpolated_topleft(alpha))
+        with Profiler.section('draw.hud'):
+            self.hud_view.draw(self.screen, self.player,
+                               self.current_order_distance -
+                               self.road.distance_traveled,
+                               self.current_order_reward,
+                               self.progress_manager.coins)
+
+    def _draw_pause_frame(self):
+        """
+        Отрисовка паузы. При входе в паузу последний шаг заезда
+        затемняется и подписывается в кадр паузы, дальше этот кадр
+        просто копируется на экран.
+        """
+        if not self.pause_frame_stale:
+            self.screen.blit(self.pause_frame, (0, 0))
+            return
+
+        # На паузе симуляция стоит, поэтому рисуется последний шаг
+        self._draw_gameplay(1.0)
+        if self.pause_overlay is None:
+            self.pause_overlay = pygame.Surface(
+                (C.WINDOW_WIDTH, C.WINDOW_HEIGHT), pygame.SRCALPHA)
+            self.pause_overlay.fill(C.PAUSE_OVERLAY_COLOR)
+        self.screen.blit(self.pause_overlay, (0, 0))
 
         font = AssetLoader.get_font(C.FONT_SIZE_TITLE)
-        pause_text = font.render("ПАУЗА", True, C.COLOR_WHITE)
+        pause_text = AssetLoader.render_text(font, "ПАУЗА", C.COLOR_WHITE)
         text_rect = pause_text.get_rect(center=(C.WINDOW_WIDTH / 2,
                                                 C.WINDOW_HEIGHT / 2))
         self.screen.blit(pause_text, text_rect)
+
+        if self.pause_frame is None:
+            self.pause_frame = self.screen.copy()
+        else:
+            self.pause_frame.blit(self.screen, (0, 0))
+        self.pause_frame_stale = False
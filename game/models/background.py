@@ -0,0 +1,131 @@
+import math
+import pygame
+from .. import constants as C
+
+
+class RoadBackground:
+    """
+    Заранее отрисованный фон дороги: газон, камни, асфальт и разметка.
+
+    Фон разбит на куски высотой ROAD_BACKGROUND_CHUNK_HEIGHT, привязанные
+    к мировым координатам (экранная Y = мировая Y + пройденное расстояние).
+    Кусок отрисовывается один раз при первом появлении на экране, а кадр
+    состоит из блитов видимых кусков.
+    """
+
+    # Общий кэш спрайтов камней: параметры камня -> изображение
+    _stone_cache = {}
+
+    def __init__(self, road):
+        self.road = road
+        self.chunk_height = C.ROAD_BACKGROUND_CHUNK_HEIGHT
+        self._chunks = {}
+        self._free_surfaces = []
+
+    def invalidate(self):
+        """Сбрасывает отрисованные куски, например при новом заезде."""
+        self._free_surfaces.extend(self._chunks.values())
+        self._chunks.clear()
+
+    def draw(self, screen, scroll):
+        """Отрисовывает видимые куски фона со смещением scroll."""
+        scroll = int(scroll)
+        # Номера кусков растут вверх: от куска у нижнего края экрана
+        # до куска, заходящего за верхний край
+        first_chunk = (scroll - C.WINDOW_HEIGHT) // self.chunk_height + 1
+        last_chunk = scroll // self.chunk_height + 1
+
+        # Куски, полностью ушедшие за нижний край, освобождаются
+        for index in [i for i in self._chunks if i < first_chunk]:
+            self._free_surfaces.append(self._chunks.pop(index))
+
+        for index in range(first_chunk, last_chunk + 1):
+            top = scroll - index * self.chunk_height
+            if top + self.chunk_height <= 0:
+                continue
+            screen.blit(self._get_chunk(index), (0, top))
+
+    def _get_chunk(self, index):
+        """Возвращает кусок фона, отрисовывая его при первом запросе."""
+        chunk = self._chunks.get(index)
+        if chunk is None:
+            if self._free_surfaces:
+                chunk = self._free_surfaces.pop()
+            else:
+                chunk = pygame.Surface((C.WINDOW_WIDTH, self.chunk_height))
+            self._render_chunk(chunk, -index * self.chunk_height)
+            self._chunks[index] = chunk
+        return chunk
+
+    def _render_chunk(self, surface, world_top):
+        """Отрисовка куска фона с верхним краем в мировой Y world_top."""
+        road = self.road
+
+        # Фон (трава)
+        surface.fill(C.COLOR_GREEN_GRASS)
+
+        # Декорации
+        decorations = road.decorations
+        offset = decorations.scroll_offset
+        for x, y, stone_width, stone_height, color_index, \
+                shadow_x, shadow_y in decorations.iter_visible(
+                    world_top - road.max_decor_height + offset,
+                    world_top + self.chunk_height + offset):
+            stone = self.get_stone_sprite(stone_width, stone_height,
+                                          color_index, shadow_x, shadow_y)
+            surface.blit(stone, (int(x - stone_width / 2),
+                                 math.floor(y - offset) - world_top))
+
+        # Дорога
+        pygame.draw.rect(surface, C.COLOR_GRAY_ROAD,
+                         (road.road_x, 0, road.road_width, self.chunk_height))
+
+        # Разметка привязана к мировым координатам с периодом
+        # ROAD_LINE_LENGTH + ROAD_LINE_GAP. Линия рисуется включая
+        # нижний пиксель, поэтому первой берется линия, которая
+        # заканчивается ровно на верхнем краю куска
+        line_x1 = road.left_border + road.road_width / 3
+        line_x2 = road.left_border + road.road_width * 2 / 3
+        period = C.ROAD_LINE_LENGTH + C.ROAD_LINE_GAP
+
+        line_y = ((world_top - C.ROAD_LINE_LENGTH - 1) // period + 1) * period
+        while line_y < world_top + self.chunk_height:
+            y_pos = line_y - world_top
+            pygame.draw.line(surface, C.COLOR_WHITE, (line_x1, y_pos),
+                             (line_x1, y_pos + C.ROAD_LINE_LENGTH),
+                             C.ROAD_LINE_WIDTH)
+            pygame.draw.line(surface, C.COLOR_WHITE, (line_x2, y_pos),
+                             (line_x2, y_pos + C.ROAD_LINE_LENGTH),
+                             C.ROAD_LINE_WIDTH)
+            line_y += period
+
+    @classmethod
+    def get_stone_sprite(cls, stone_width, stone_height, color_index,
+                         shadow_x, shadow_y):
+        """
+        Возвращает спрайт камня с тенью, общий для всех камней
+        с такими же параметрами.
+        """
+        cache_key = (stone_width, stone_height, color_index,
+                     shadow_x, shadow_y)
+        stone = cls._stone_cache.get(cache_key)
+        if stone is None:
+            stone_color = C.SMALL_STONE_COLORS[color_index]
+            stone = pygame.Surface((stone_width, stone_height),
+                                   pygame.SRCALPHA)
+
+            # Камень (эллипс)
+            pygame.draw.ellipse(stone, stone_color,
+                                (0, 0, stone_width, stone_height))
+
+            # Тень: меньший эллипс со смещением
+            shadow_color = (max(0, stone_color[0] - 20),
+                            max(0, stone_color[1] - 20),
+                            max(0, stone_color[2] - 20))
+            pygame.draw.ellipse(stone, shadow_color,
+                                (shadow_x, shadow_y,
+                                 stone_width - shadow_x,
+                                 stone_height - shadow_y))
+
+            cls._stone_cache[cache_key] = stone
+        return stone
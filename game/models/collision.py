@@ -0,0 +1,72 @@
+import bisect
+from operator import attrgetter
+
+
+_rect_top = attrgetter('rect.top')
+
+
+class LaneIndex:
+    """
+    Грубая фаза проверки столкновений: препятствия разложены
+    по полосам и отсортированы по верхней границе.
+    """
+
+    def __init__(self, lane_centers, max_reach_x, max_height):
+        self.lane_centers = list(lane_centers)
+        # Максимальное удаление маски препятствия от центра его полосы
+        self.max_reach_x = max_reach_x
+        # Максимальная высота маски препятствия
+        self.max_height = max_height
+
+        self._buckets = {lane_x: [] for lane_x in self.lane_centers}
+        self._tops = {lane_x: [] for lane_x in self.lane_centers}
+
+    def rebuild(self, obstacles):
+        """Перестраивает индекс по текущему положению препятствий."""
+        for bucket in self._buckets.values():
+            bucket.clear()
+
+        for obstacle in obstacles:
+            self._buckets[obstacle.lane_x].append(obstacle)
+
+        for lane_x, bucket in self._buckets.items():
+            bucket.sort(key=_rect_top)
+            tops = self._tops[lane_x]
+            tops.clear()
+            tops.extend(obstacle.rect.top for obstacle in bucket)
+
+    def remove(self, obstacle):
+        """Удаляет препятствие из индекса до следующей перестройки."""
+        bucket = self._buckets.get(obstacle.lane_x)
+        if bucket and obstacle in bucket:
+            index = bucket.index(obstacle)
+            del bucket[index]
+            del self._tops[obstacle.lane_x][index]
+
+    def clear(self):
+        """Очищает индекс."""
+        for lane_x in self.lane_centers:
+            self._buckets[lane_x].clear()
+            self._tops[lane_x].clear()
+
+    def candidates(self, rect):
+        """
+        Возвращает препятствия, чьи маски могут пересекаться
+        с прямоугольником rect, пропуская закрытые люки.
+        """
+        result = []
+        for lane_x in self.lane_centers:
+            if (lane_x + self.max_reach_x < rect.left or
+                    lane_x - self.max_reach_x > rect.right):
+                continue
+
+            bucket = self._buckets[lane_x]
+            tops = self._tops[lane_x]
+            # Верхняя граница препятствия должна быть в интервале
+            # (rect.top - max_height, rect.bottom)
+            lo = bisect.bisect_right(tops, rect.top - self.max_height)
+            hi = bisect.bisect_left(tops, rect.bottom)
+            for obstacle in bucket[lo:hi]:
+                if obstacle.is_collidable:
+                    result.append(obstacle)
+        return result
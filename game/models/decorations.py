@@ -0,0 +1,115 @@
+from array import array
+
+
+class DecorationStore:
+    """
+    Хранилище декораций газона в виде параллельных массивов.
+
+    Декорации лежат в кольцевом буфере в порядке появления. Координата Y
+    хранится относительно общего смещения прокрутки, поэтому прокрутка
+    всех декораций - это одно сложение, а удаление ушедших за нижний
+    край экрана - сдвиг начала буфера.
+    """
+
+    def __init__(self, capacity=256):
+        self._capacity = capacity
+        self.x = array('d', [0.0]) * capacity
+        self.y = array('d', [0.0]) * capacity
+        self.width = array('H', [0]) * capacity
+        self.height = array('H', [0]) * capacity
+        self.color = array('B', [0]) * capacity
+        self.shadow_x = array('B', [0]) * capacity
+        self.shadow_y = array('B', [0]) * capacity
+
+        self.head = 0
+        self.count = 0
+        self.scroll_offset = 0.0
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Удаляет все декорации."""
+        self.head = 0
+        self.count = 0
+        self.scroll_offset = 0.0
+
+    def scroll(self, dy):
+        """Сдвигает все декорации вниз на dy пикселей."""
+        self.scroll_offset += dy
+
+    def extend(self, xs, ys, widths, heights, colors, shadows_x, shadows_y):
+        """
+        Добавляет пачку декораций. ys - экранные координаты,
+        colors - индексы цветов в SMALL_STONE_COLORS,
+        shadows_x и shadows_y - смещения тени.
+        """
+        batch_size = len(xs)
+        if self.count + batch_size > self._capacity:
+            self._grow(self.count + batch_size)
+
+        index = (self.head + self.count) % self._capacity
+        for i in range(batch_size):
+            self.x[index] = xs[i]
+            self.y[index] = ys[i] - self.scroll_offset
+            self.width[index] = widths[i]
+            self.height[index] = heights[i]
+            self.color[index] = colors[i]
+            self.shadow_x[index] = shadows_x[i]
+            self.shadow_y[index] = shadows_y[i]
+            index += 1
+            if index == self._capacity:
+                index = 0
+        self.count += batch_size
+
+    def cull(self, max_y):
+        """
+        Удаляет из начала буфера декорации, ушедшие ниже max_y.
+        Возвращает количество удаленных декораций.
+        """
+        removed = 0
+        limit = max_y - self.scroll_offset
+        while self.count and self.y[self.head] > limit:
+            self.head += 1
+            if self.head == self._capacity:
+                self.head = 0
+            self.count -= 1
+            removed += 1
+        return removed
+
+    def iter_visible(self, min_y, max_y):
+        """
+        Перебирает декорации с экранной координатой Y в (min_y, max_y)
+        в виде (x, y, ширина, высота, индекс цвета, смещения тени).
+        """
+        offset = self.scroll_offset
+        lo = min_y - offset
+        hi = max_y - offset
+        index = self.head
+        for _ in range(self.count):
+            y = self.y[index]
+            if lo < y < hi:
+                yield (self.x[index], y + offset, self.width[index],
+                       self.height[index], self.color[index],
+                       self.shadow_x[index], self.shadow_y[index])
+            index += 1
+            if index == self._capacity:
+                index = 0
+
+    def _grow(self, min_capacity):
+        """Увеличивает буфер, сохраняя порядок декораций."""
+        new_capacity = self._capacity
+        while new_capacity < min_capacity:
+            new_capacity *= 2
+
+        for name in ('x', 'y', 'width', 'height', 'color',
+                     'shadow_x', 'shadow_y'):
+            old = getattr(self, name)
+            ordered = (old[self.head:self.head + self.count] +
+                       old[:max(0, self.head + self.count - self._capacity)])
+            ordered.extend(array(old.typecode, [0]) *
+                           (new_capacity - self.count))
+            setattr(self, name, ordered)
+
+        self._capacity = new_capacity
+        self.head = 0
@@ -1,5 +1,5 @@
 import pygame
-import random
+import math
 from abc import ABC, abstractmethod
 from .. import constants as C
 from ..services.asset_loader import AssetLoader
@@ -8,16 +8,85 @@ from ..services.asset_loader import AssetLoader
 class Obstacle(pygame.sprite.Sprite, ABC):
     """Абстрактный базовый класс для всех препятствий."""
 
-    def __init__(self, lane_x):
+    def __init__(self, lane_x, rng):
         super().__init__()
+        self.pool = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(lane_x, rng)
+
+    @abstractmethod
+    def reset(self, lane_x, rng):
+        """
+        Приводит препятствие в начальное состояние на заданной полосе,
+        беря случайные параметры из генератора rng.
+        """
         self.lane_x = lane_x
 
     @abstractmethod
     def update(self, dt, road_speed):
         """Обновляет позицию и состояние препятствия."""
-        self.rect.y += road_speed * dt
+        self._move(road_speed * dt)
+
+    def _move(self, dy):
+        """
+        Сдвигает препятствие вниз, запоминая предыдущую позицию
+        для интерполяции при отрисовке.
+        """
+        self.prev_y = self.y
+        self.y += dy
+        self.rect.y = round(self.y)
         if self.rect.top > C.WINDOW_HEIGHT:
-            self.kill()
+            self.release()
+
+    def interpolated_y(self, alpha):
+        """Позиция Y между двумя последними шагами симуляции."""
+        return round(self.prev_y + (self.y - self.prev_y) * alpha)
+
+    @property
+    def is_collidable(self):
+        """Может ли препятствие сейчас столкнуться с игроком."""
+        return True
+
+    def release(self):
+        """Убирает препятствие с дороги и возвращает его в пул."""
+        if not self.alive():
+            return
+        self.kill()
+        if self.pool is not None:
+            self.pool.put_back(self)
+
+
+class ObstaclePool:
+    """Пулы свободных препятствий для повторного использования по типам."""
+
+    def __init__(self):
+        self._free_lists = {}
+
+    def prefill(self, obstacle_cls, count, rng, lane_x=0):
+        """Заранее создает заданное количество препятствий."""
+        free_list = self._free_lists.setdefault(obstacle_cls, [])
+        for _ in range(count - len(free_list)):
+            obstacle = obstacle_cls(lane_x, rng)
+            obstacle.pool = self
+            free_list.append(obstacle)
+
+    def acquire(self, obstacle_cls, lane_x, rng):
+        """
+        Возвращает препятствие заданного типа на полосе lane_x.
+        Новый объект создается, только если свободный список пуст.
+        """
+        free_list = self._free_lists.setdefault(obstacle_cls, [])
+        if free_list:
+            obstacle = free_list.pop()
+            obstacle.reset(lane_x, rng)
+        else:
+            obstacle = obstacle_cls(lane_x, rng)
+            obstacle.pool = self
+        return obstacle
+
+    def put_back(self, obstacle):
+        """Возвращает препятствие в свободный список его типа."""
+        self._free_lists.setdefault(type(obstacle), []).append(obstacle)
 
 
 class OncomingCar(Obstacle):
@@ -34,21 +103,58 @@ class OncomingCar(Obstacle):
         (255, 165, 0)
     ]
 
-    def __init__(self, lane_x):
-        super().__init__(lane_x)
+    # Общий кэш спрайтов: цвет кузова -> (изображение, маска)
+    _sprite_cache = {}
+
+    def reset(self, lane_x, rng):
+        """Выбирает новый цвет и скорость машины и ставит ее на полосу."""
+        super().reset(lane_x, rng)
 
-        self.image = pygame.Surface((C.CAR_WIDTH + 20, C.CAR_HEIGHT + 20),
-                                    pygame.SRCALPHA)
+        car_body_color = rng.choice(self.BODY_COLORS)
+        self.image, self.mask = self.get_sprite(car_body_color)
 
-        car_body_color = random.choice(self.BODY_COLORS)
+        self.rect.size = (C.CAR_WIDTH, C.CAR_HEIGHT)
+        self.rect.centerx = lane_x
+        self.rect.bottom = 0
+        self.y = self.prev_y = float(self.rect.y)
+
+        self.image_offset_x = (self.image.get_width() - self.rect.width) / 2
+        self.image_offset_y = (self.image.get_height() - self.rect.height) / 2
+
+        self.speed = rng.uniform(100, 200)
+
+    @classmethod
+    def preload_sprites(cls):
+        """Заранее отрисовывает все цветовые варианты машин."""
+        for car_body_color in cls.BODY_COLORS:
+            cls.get_sprite(car_body_color)
+
+    @classmethod
+    def get_sprite(cls, car_body_color):
+        """
+        Возвращает общее для всех машин изображение и маску
+        для заданного цвета кузова, отрисовывая их при первом запросе.
+        """
+        cache_key = (tuple(car_body_color), C.CAR_WIDTH, C.CAR_HEIGHT)
+        if cache_key not in cls._sprite_cache:
+            image = cls._render_car(car_body_color)
+            cls._sprite_cache[cache_key] = (image,
+                                            pygame.mask.from_surface(image))
+        return cls._sprite_cache[cache_key]
+
+    @staticmethod
+    def _render_car(car_body_color):
+        """Программная отрисовка машины заданного цвета."""
+        image = pygame.Surface((C.CAR_WIDTH + 20, C.CAR_HEIGHT + 20),
+                               pygame.SRCALPHA)
 
         # Отрисовка кузова
         main_body_rect = pygame.Rect(10, 10, C.CAR_WIDTH, C.CAR_HEIGHT)
-        pygame.draw.rect(self.image, car_body_color, main_body_rect,
+        pygame.draw.rect(image, car_body_color, main_body_rect,
                          border_radius=8)
 
         pygame.draw.rect(
-            self.image,
+            image,
             (max(0, car_body_color[0]-30),
              max(0, car_body_color[1]-30),
              max(0, car_body_color[2]-30)),
@@ -60,12 +166,12 @@ class OncomingCar(Obstacle):
         wheel_width = int(C.CAR_WIDTH * 0.3)
         wheel_height = int(C.CAR_HEIGHT * 0.15)
 
-        pygame.draw.rect(self.image, C.COLOR_BLACK,
+        pygame.draw.rect(image, C.COLOR_BLACK,
                          (10 + int(C.CAR_WIDTH * 0.05),
                           C.CAR_HEIGHT - wheel_height + 10,
                           wheel_width, wheel_height),
                          border_radius=3)
-        pygame.draw.rect(self.image, C.COLOR_BLACK,
+        pygame.draw.rect(image, C.COLOR_BLACK,
                          (10 + C.CAR_WIDTH - wheel_width -
                           int(C.CAR_WIDTH * 0.05),
                           C.CAR_HEIGHT - wheel_height + 10,
@@ -77,14 +183,14 @@ class OncomingCar(Obstacle):
         rim_height = int(wheel_height * 0.6)
 
         pygame.draw.rect(
-            self.image, (180, 180, 180),
+            image, (180, 180, 180),
             (10 + int(C.CAR_WIDTH * 0.05) + (wheel_width - rim_width)/2,
              C.CAR_HEIGHT - wheel_height + 10 + (wheel_height - rim_height)/2,
              rim_width, rim_height),
             border_radius=2
         )
         pygame.draw.rect(
-            self.image, (180, 180, 180),
+            image, (180, 180, 180),
             (10 + C.CAR_WIDTH - wheel_width - int(C.CAR_WIDTH * 0.05) +
              (wheel_width - rim_width)/2,
              C.CAR_HEIGHT - wheel_height + 10 + (wheel_height - rim_height)/2,
@@ -97,19 +203,19 @@ class OncomingCar(Obstacle):
         window_main_height = int(C.CAR_HEIGHT * 0.3)
         window_main_x = (C.CAR_WIDTH - window_main_width) / 2 + 10
         window_main_y = int(C.CAR_HEIGHT * 0.2) + 10
-        pygame.draw.rect(self.image, C.COLOR_BLUE_SKY,
+        pygame.draw.rect(image, C.COLOR_BLUE_SKY,
                          (window_main_x, window_main_y,
                           window_main_width, window_main_height),
                          border_radius=5)
 
         side_window_width = int(C.CAR_WIDTH * 0.2)
         side_window_height = int(C.CAR_HEIGHT * 0.25)
-        pygame.draw.rect(self.image, C.COLOR_BLUE_SKY,
+        pygame.draw.rect(image, C.COLOR_BLUE_SKY,
                          (10 + int(C.CAR_WIDTH * 0.05),
                           window_main_y + 5,
                           side_window_width, side_window_height),
                          border_radius=3)
-        pygame.draw.rect(self.image, C.COLOR_BLUE_SKY,
+        pygame.draw.rect(image, C.COLOR_BLUE_SKY,
                          (10 + C.CAR_WIDTH - side_window_width -
                           int(C.CAR_WIDTH * 0.05),
                           window_main_y + 5,
@@ -121,33 +227,23 @@ class OncomingCar(Obstacle):
         light_height = int(C.CAR_HEIGHT * 0.08)
         light_offset = int(C.CAR_WIDTH * 0.08)
 
-        pygame.draw.rect(self.image, C.COLOR_GOLD,
+        pygame.draw.rect(image, C.COLOR_GOLD,
                          (10 + light_offset,
                           C.CAR_HEIGHT + 10 - light_height - 5,
                           light_width, light_height),
                          border_radius=2)
-        pygame.draw.rect(self.image, C.COLOR_GOLD,
+        pygame.draw.rect(image, C.COLOR_GOLD,
                          (10 + C.CAR_WIDTH - light_offset - light_width,
                           C.CAR_HEIGHT + 10 - light_height - 5,
                           light_width, light_height),
                          border_radius=2)
 
-        self.rect = pygame.Rect(0, 0, C.CAR_WIDTH, C.CAR_HEIGHT)
-        self.rect.centerx = lane_x
-        self.rect.bottom = 0
-
-        self.image_offset_x = (self.image.get_width() - self.rect.width) / 2
-        self.image_offset_y = (self.image.get_height() - self.rect.height) / 2
-
-        self.mask = pygame.mask.from_surface(self.image)
-        self.speed = random.uniform(100, 200)
+        return image
 
     def update(self, dt, road_speed):
         """Обновляет позицию машины."""
         effective_speed = road_speed + self.speed
-        self.rect.y += effective_speed * dt
-        if self.rect.top > C.WINDOW_HEIGHT:
-            self.kill()
+        self._move(effective_speed * dt)
 
     def draw(self, screen):
         """Отрисовывает машину с учетом смещения изображения."""
@@ -158,10 +254,48 @@ class OncomingCar(Obstacle):
 class Manhole(Obstacle):
     """Препятствие - канализационный люк."""
 
-    def __init__(self, lane_x):
-        super().__init__(lane_x)
+    # Общая таблица кадров: направление -> [(изображение, маска), ...]
+    _frame_table = None
 
-        self.original_cover_image = AssetLoader.get_image(
+    def reset(self, lane_x, rng):
+        """Закрывает люк и ставит его на полосу."""
+        super().reset(lane_x, rng)
+
+        self.open_direction = rng.choice([-1, 1])
+
+        self.frames = self.get_frames()[self.open_direction]
+        self.image, self.mask = self.frames[0]
+
+        self.rect.size = self.image.get_size()
+        self.rect.centerx = lane_x
+        self.rect.bottom = 0
+        self.y = self.prev_y = float(self.rect.y)
+
+        self.is_open = False
+        self.open_progress = 0.0
+        self.is_transitioning = False
+
+    @classmethod
+    def get_frames(cls):
+        """
+        Возвращает таблицу кадров открытия люка, общую для всех люков.
+        Строится один раз при первом обращении.
+        """
+        if cls._frame_table is None:
+            cls._frame_table = {
+                direction: [cls._render_frame(direction, step)
+                            for step in range(C.MANHOLE_ANIMATION_FRAMES + 1)]
+                for direction in (-1, 1)
+            }
+        return cls._frame_table
+
+    @staticmethod
+    def _render_frame(open_direction, step):
+        """
+        Отрисовывает кадр люка с крышкой, сдвинутой по диагонали
+        на долю step / MANHOLE_ANIMATION_FRAMES.
+        """
+        cover_image = AssetLoader.get_image(
             C.IMG_MANHOLE, (C.MANHOLE_SIZE, C.MANHOLE_SIZE)
         )
 
@@ -171,28 +305,50 @@ class Manhole(Obstacle):
         if image_height < C.MANHOLE_SIZE:
             image_height = C.MANHOLE_SIZE
 
-        self.image = pygame.Surface((C.MANHOLE_SIZE * 2, image_height),
-                                    pygame.SRCALPHA)
+        image = pygame.Surface((C.MANHOLE_SIZE * 2, image_height),
+                               pygame.SRCALPHA)
 
-        self.initial_cover_y_on_image = (image_height - C.MANHOLE_SIZE) / 2
-        self.initial_cover_x_on_image = (self.image.get_width() / 2 -
-                                         C.MANHOLE_SIZE / 2)
+        initial_cover_y_on_image = (image_height - C.MANHOLE_SIZE) / 2
+        initial_cover_x_on_image = (image.get_width() / 2 -
+                                    C.MANHOLE_SIZE / 2)
 
-        self.image.blit(self.original_cover_image,
-                        (self.initial_cover_x_on_image,
-                         self.initial_cover_y_on_image))
+        if step == 0:
+            # Закрытый люк: только крышка
+            image.blit(cover_image,
+                       (initial_cover_x_on_image, initial_cover_y_on_image))
+            return image, pygame.mask.from_surface(image)
 
-        self.rect = self.image.get_rect()
-        self.rect.centerx = lane_x
-        self.rect.bottom = 0
+        open_progress = step / C.MANHOLE_ANIMATION_FRAMES
 
-        self.mask = pygame.mask.from_surface(self.image)
+        hole_center_x_on_image = initial_cover_x_on_image + \
+            C.MANHOLE_SIZE / 2
+        hole_center_y_on_image = initial_cover_y_on_image + \
+            C.MANHOLE_SIZE / 2
+        pygame.draw.circle(image, C.COLOR_BLACK,
+                           (int(hole_center_x_on_image),
+                            int(hole_center_y_on_image)),
+                           int(C.MANHOLE_SIZE / 2 * 0.8))
 
-        self.is_open = False
-        self.open_progress = 0.0
-        self.is_transitioning = False
+        horizontal_displacement = (open_progress * C.MANHOLE_SIZE *
+                                   C.MANHOLE_OPEN_OFFSET_MULTIPLIER)
 
-        self.open_direction = random.choice([-1, 1])
+        vertical_displacement = (open_progress * C.MANHOLE_SIZE *
+                                 C.MANHOLE_DIAGONAL_OFFSET_FACTOR)
+
+        current_cover_x = (initial_cover_x_on_image +
+                           (horizontal_displacement * open_direction))
+        current_cover_y = initial_cover_y_on_image + \
+            vertical_displacement
+
+        image.blit(cover_image,
+                   (int(current_cover_x), int(current_cover_y)))
+
+        return image, pygame.mask.from_surface(image)
+
+    @property
+    def is_collidable(self):
+        """Закрытый люк безопасен для игрока."""
+        return self.is_open
 
     def update(self, dt, road_speed):
         """Обновляет люк, включая логику открытия."""
@@ -210,36 +366,11 @@ class Manhole(Obstacle):
 
             if self.open_progress >= 1.0:
                 self.is_open = True
-                self.mask = pygame.mask.from_surface(self.image)
 
     def _animate_opening(self):
         """
-        Перерисовывает изображение люка, анимируя сдвиг крышки
-        в случайную сторону по диагонали.
+        Переключает изображение и маску люка на кадр,
+        соответствующий текущему прогрессу открытия.
         """
-        self.image.fill((0, 0, 0, 0))
-
-        hole_center_x_on_image = self.initial_cover_x_on_image + \
-            C.MANHOLE_SIZE / 2
-        hole_center_y_on_image = self.initial_cover_y_on_image + \
-            C.MANHOLE_SIZE / 2
-        pygame.draw.circle(self.image, C.COLOR_BLACK,
-                           (int(hole_center_x_on_image),
-                            int(hole_center_y_on_image)),
-                           int(C.MANHOLE_SIZE / 2 * 0.8))
-
-        horizontal_displacement = (self.open_progress * C.MANHOLE_SIZE *
-                                   C.MANHOLE_OPEN_OFFSET_MULTIPLIER)
-
-        vertical_displacement = (self.open_progress * C.MANHOLE_SIZE *
-                                 C.MANHOLE_DIAGONAL_OFFSET_FACTOR)
-
-        current_cover_x = (self.initial_cover_x_on_image +
-                           (horizontal_displacement * self.open_direction))
-        current_cover_y = self.initial_cover_y_on_image + \
-            vertical_displacement
-
-        self.image.blit(self.original_cover_image,
-                        (int(current_cover_x), int(current_cover_y)))
-
-        self.mask = pygame.mask.from_surface(self.image)
+        step = math.ceil(self.open_progress * C.MANHOLE_ANIMATION_FRAMES)
+        self.image, self.mask = self.frames[step]
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-import random
+from .. import constants as C
+from ..services.rng import RandomStreams
 
 
 @dataclass
@@ -22,7 +23,9 @@ class OrderManager:
         Order("Вок с курицей", 120, 22000),
     ]
 
-    def __init__(self):
+    def __init__(self, rng=None):
+        # Поток случайных чисел rng.orders
+        self.rng = rng or RandomStreams()
         self.available_orders = []
         self.selected_order = None
         self.selected_route_type = None
@@ -30,7 +33,7 @@ class OrderManager:
 
     def generate_new_orders(self, count=3):
         """Генерирует новый список доступных заказов."""
-        self.available_orders = random.sample(
+        self.available_orders = self.rng.orders.sample(
             self._POSSIBLE_ORDERS, min(count, len(self._POSSIBLE_ORDERS)))
         self.selected_order = None
         self.selected_route_type = None
@@ -40,7 +43,7 @@ class OrderManager:
             self.selected_order = self.available_orders[order_index]
 
     def select_route(self, route_type):
-        if route_type in ['short', 'long']:
+        if route_type in C.ROUTE_PARAMETERS:
             self.selected_route_type = route_type
 
     def get_final_parameters(self):
@@ -48,11 +51,9 @@ class OrderManager:
         if not self.selected_order or not self.selected_route_type:
             return None
 
-        if self.selected_route_type == 'long':
-            distance = self.selected_order.base_distance * 1.5
-            reward = self.selected_order.reward * 1.0
-        else:
-            distance = self.selected_order.base_distance * 0.7
-            reward = self.selected_order.reward * 2.0
+        route = C.ROUTE_PARAMETERS[self.selected_route_type]
+        distance = (self.selected_order.base_distance *
+                    route['distance_multiplier'])
+        reward = self.selected_order.reward * route['reward_multiplier']
 
         return int(distance), int(reward)
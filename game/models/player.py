@@ -27,6 +27,7 @@ class Player(pygame.sprite.Sprite):
         self.current_lane_index = 1
         self.rect.centerx = self.lane_centers[self.current_lane_index]
         self.target_x = self.rect.centerx
+        self.x = self.prev_x = float(self.target_x)
 
         self.speed = 0.0
         self.energy = C.PLAYER_MAX_ENERGY
@@ -42,17 +43,28 @@ class Player(pygame.sprite.Sprite):
         self.max_lives = vehicle_stats['lives']
         self._setup_initial_state()
 
-    def handle_input(self, event):
-        """Обрабатывает ввод, относящийся к игроку."""
+    def handle_input(self, event, held=None):
+        """
+        Обрабатывает ввод, относящийся к игроку.
+        held - зажатые (ускорение, торможение); по умолчанию
+        читаются с клавиатуры.
+        """
         if event.type == pygame.KEYDOWN:
             if event.key in (pygame.K_LEFT, pygame.K_a):
                 self._move_lane(-1)
             elif event.key in (pygame.K_RIGHT, pygame.K_d):
                 self._move_lane(1)
 
+        if held is None:
+            held = self.read_held_keys()
+        self.is_boosting, self.is_braking = held
+
+    @staticmethod
+    def read_held_keys():
+        """Возвращает, зажаты ли клавиши ускорения и торможения."""
         keys = pygame.key.get_pressed()
-        self.is_boosting = keys[pygame.K_UP] or keys[pygame.K_w]
-        self.is_braking = keys[pygame.K_DOWN] or keys[pygame.K_s]
+        return (bool(keys[pygame.K_UP] or keys[pygame.K_w]),
+                bool(keys[pygame.K_DOWN] or keys[pygame.K_s]))
 
     def _move_lane(self, direction):
         """Логика смены полосы движения."""
@@ -64,6 +76,7 @@ class Player(pygame.sprite.Sprite):
 
     def update(self, dt):
         """Обновляет состояние игрока."""
+        self.prev_x = self.x
         if not self.alive:
             return
 
@@ -100,11 +113,17 @@ class Player(pygame.sprite.Sprite):
     def _update_horizontal_position(self, dt):
         """Плавное перемещение между полосами."""
         move_speed = 800 * dt
-        dx = self.target_x - self.rect.centerx
+        dx = self.target_x - self.x
         if abs(dx) < move_speed:
-            self.rect.centerx = self.target_x
+            self.x = self.target_x
         else:
-            self.rect.centerx += move_speed * (1 if dx > 0 else -1)
+            self.x += move_speed * (1 if dx > 0 else -1)
+        self.rect.centerx = round(self.x)
+
+    def interpolated_topleft(self, alpha):
+        """Позиция спрайта между двумя последними шагами симуляции."""
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        return (round(x - self.rect.width / 2), self.rect.y)
 
     def take_damage(self):
         """Обработка получения урона."""
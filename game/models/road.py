@@ -1,70 +1,43 @@
 import pygame
-import random
 from .. import constants as C
-from .obstacles import OncomingCar, Manhole
-
-
-class DecorativeElement:
-    """Класс для программно нарисованных декоративных элементов."""
-
-    def __init__(self, type, x, y, draw_data):
-        self.type = type
-        self.x = x
-        self.y = y
-        self.draw_data = draw_data
-
-    def update(self, dt, road_speed):
-        # Декорации движутся только с дорогой
-        self.y += road_speed * dt
-
-    def draw(self, screen):
-        if self.type == 'small_stone':
-            stone_width = self.draw_data['stone_width']
-            stone_height = self.draw_data['stone_height']
-            stone_color = self.draw_data['stone_color']
-
-            # Камень (эллипс)
-            stone_rect = pygame.Rect(self.x - stone_width / 2,
-                                     self.y,
-                                     stone_width,
-                                     stone_height)
-            pygame.draw.ellipse(screen, stone_color, stone_rect)
-
-            # Тень
-            shadow_offset_x = random.randint(1, 3)
-            shadow_offset_y = random.randint(1, 3)
-            shadow_color = (max(0, stone_color[0] - 20),
-                            max(0, stone_color[1] - 20),
-                            max(0, stone_color[2] - 20))
-            # Отрисовка меньшего эллипса со смещением
-            pygame.draw.ellipse(
-                screen, shadow_color,
-                (stone_rect.x + shadow_offset_x,
-                 stone_rect.y + shadow_offset_y,
-                 stone_rect.width - shadow_offset_x,
-                 stone_rect.height - shadow_offset_y)
-            )
+from ..services.rng import RandomStreams
+from ..services.profiler import Profiler
+from .obstacles import OncomingCar, Manhole, ObstaclePool
+from .collision import LaneIndex
+from .decorations import DecorationStore
+from .background import RoadBackground
 
 
 class Road:
     """Управляет дорогой, препятствиями и декорациями."""
 
-    def __init__(self, lane_centers, current_route_type):
+    def __init__(self, lane_centers, current_route_type, rng=None):
         self.lane_centers = lane_centers
+        # Потоки случайных чисел: rng.traffic и rng.decorations
+        self.rng = rng or RandomStreams()
         self.obstacles = pygame.sprite.Group()
-        self.decorations = []
+        self.obstacle_pool = ObstaclePool()
+        self.obstacle_pool.prefill(OncomingCar, C.OBSTACLE_POOL_PREFILL,
+                                   self.rng.traffic)
+        self.obstacle_pool.prefill(Manhole, C.OBSTACLE_POOL_PREFILL,
+                                   self.rng.traffic)
+        # Маска машины сдвинута на 20px вправо и вниз относительно rect,
+        # маска люка шириной MANHOLE_SIZE * 2 центрирована по полосе
+        self.lane_index = LaneIndex(
+            lane_centers,
+            max_reach_x=max(C.CAR_WIDTH / 2 + 20, C.MANHOLE_SIZE),
+            max_height=max(C.CAR_HEIGHT + 20,
+                           C.MANHOLE_SIZE *
+                           (1 + 2 * C.MANHOLE_DIAGONAL_OFFSET_FACTOR)))
+        self.decorations = DecorationStore()
+        # Максимальная высота маленького камня для корректного
+        # удаления/появления
+        self.max_decor_height = (max(C.SMALL_STONE_SIZE_RANGE) *
+                                 C.SMALL_STONE_ASPECT_RATIO_VARIATION[1])
         self.distance_traveled = 0
+        self.prev_distance_traveled = 0
         self.current_route_type = current_route_type
 
-        # Для разметки
-        self.line_y_positions = [
-            y for y in range(
-                -C.WINDOW_HEIGHT,
-                C.WINDOW_HEIGHT,
-                C.ROAD_LINE_LENGTH + C.ROAD_LINE_GAP
-            )
-        ]
-
         # Геометрия дороги
         self.road_width = C.WINDOW_WIDTH * C.ROAD_WIDTH_RATIO
         self.road_x = (C.WINDOW_WIDTH - self.road_width) / 2
@@ -75,19 +48,24 @@ class Road:
 
         # Для появления препятствий
         self.obstacle_spawn_timer = 0.0
-        # Для появления декораций
-        self.decoration_spawn_timer = 0.0
+        # Для появления декораций: мировая Y, до которой газон
+        # уже заполнен камнями
+        self.decoration_frontier_y = 0.0
 
+        self.background = RoadBackground(self)
         self._initial_spawn_decorations()
 
     def reset(self, current_route_type):
         """Сброс состояния дороги для новой игры."""
-        self.obstacles.empty()
+        for obstacle in self.obstacles.sprites():
+            obstacle.release()
+        self.lane_index.clear()
         self.decorations.clear()
         self.distance_traveled = 0
+        self.prev_distance_traveled = 0
         self.obstacle_spawn_timer = 1.0 / C.OBSTACLE_SPAWN_RATE
-        self.decoration_spawn_timer = 0.0
         self.current_route_type = current_route_type
+        self.background.invalidate()
         self._initial_spawn_decorations()
 
     def _initial_spawn_decorations(self):
@@ -95,42 +73,36 @@ class Road:
         y_step = C.DECORATION_INITIAL_SPAWN_INTERVAL
         start_y = C.WINDOW_HEIGHT + 200
 
+        rng = self.rng.decorations
+        spawn_ys = []
         current_y = start_y
         while current_y > C.DECORATION_MIN_Y_SPAWN - 200:
-            num_decorations_at_y = random.randint(5, 10)
+            num_decorations_at_y = rng.randint(5, 10)
             for _ in range(num_decorations_at_y):
                 # Небольшая случайность по Y
-                self._spawn_decoration(current_y +
-                                       random.uniform(-y_step/2, y_step/2))
+                spawn_ys.append(current_y +
+                                rng.uniform(-y_step/2, y_step/2))
             current_y -= y_step
 
+        self._spawn_decorations(spawn_ys)
+        self.decoration_frontier_y = current_y
+        self._update_decoration_spawning()
+
     def update(self, dt, player_speed):
         """Обновление состояния дороги, препятствий и декораций."""
+        self.prev_distance_traveled = self.distance_traveled
         self.distance_traveled += player_speed * dt
-        self._update_road_lines(dt, player_speed)
-        self._update_obstacle_spawning(dt)
-        self._update_decoration_spawning(dt, player_speed)
-
-        self.obstacles.update(dt, player_speed)
-
-        # Обновление и удаление декораций
-        for decor in list(self.decorations):
-            decor.update(dt, player_speed)
-            # Максимальная высота маленького камня
-            max_decor_height = (max(C.SMALL_STONE_SIZE_RANGE) *
-                                C.SMALL_STONE_ASPECT_RATIO_VARIATION[1])
-            if decor.y > C.WINDOW_HEIGHT + max_decor_height:
-                self.decorations.remove(decor)
-
-    def _update_road_lines(self, dt, player_speed):
-        """Движение дорожной разметки."""
-        for i in range(len(self.line_y_positions)):
-            self.line_y_positions[i] += player_speed * dt
-            if self.line_y_positions[i] > C.WINDOW_HEIGHT:
-                # Перемещение линии вверх
-                self.line_y_positions[i] -= (C.WINDOW_HEIGHT +
-                                             C.ROAD_LINE_LENGTH +
-                                             C.ROAD_LINE_GAP)
+        with Profiler.section('update.spawning'):
+            self._update_obstacle_spawning(dt)
+            self._update_decoration_spawning()
+
+        with Profiler.section('update.road'):
+            self.obstacles.update(dt, player_speed)
+            self.lane_index.rebuild(self.obstacles)
+
+            # Декорации движутся только с дорогой
+            self.decorations.scroll(player_speed * dt)
+            self.decorations.cull(C.WINDOW_HEIGHT + self.max_decor_height)
 
     def _update_obstacle_spawning(self, dt):
         """Логика появления новых препятствий."""
@@ -140,107 +112,122 @@ class Road:
             self._spawn_obstacle()
 
     def _spawn_obstacle(self):
-        """Создает и добавляет новое препятствие на случайную полосу."""
-        lane_x = random.choice(self.lane_centers)
+        """Берет из пула новое препятствие и ставит его на случайную полосу."""
+        # Новые препятствия появляются с нижней границей в y = 0,
+        # поэтому расстояние проверяется до выбора препятствия
+        for existing_obstacle in self.obstacles:
+            if abs(existing_obstacle.rect.bottom) < C.OBSTACLE_MIN_SPACING:
+                return
+
+        rng = self.rng.traffic
+        lane_x = rng.choice(self.lane_centers)
 
         # Если маршрут "long", появляются только люки
         if self.current_route_type == 'long':
-            obstacle = Manhole(lane_x)
+            obstacle_cls = Manhole
         else:
-            if random.random() < C.CAR_SPAWN_CHANCE:
-                obstacle = OncomingCar(lane_x)
+            if rng.random() < C.CAR_SPAWN_CHANCE:
+                obstacle_cls = OncomingCar
             else:
-                obstacle = Manhole(lane_x)
-
-        for existing_obstacle in self.obstacles:
-            if abs(existing_obstacle.rect.bottom - obstacle.rect.bottom) < 200:
-                return
-
-        self.obstacles.add(obstacle)
-
-    def _update_decoration_spawning(self, dt, player_speed):
-        """Логика появления новых декоративных элементов на газоне."""
-        if random.random() < C.DECORATION_SPAWN_CHANCE_PER_FRAME:
-            self._spawn_decoration()
-
-    def _spawn_decoration(self, spawn_y=None):
-        """Создает и добавляет новый декоративный элемент на газон."""
-        decor_type = 'small_stone'
-
-        side = random.randint(0, 1)
-
-        # Определяем диапазон X-координат для спавна на газоне
-        if side == 0:  # Левый газон
-            x_min = C.WINDOW_WIDTH * C.DECORATION_SIDE_MARGIN_PERCENT
-            x_max = (self.left_border -
-                     C.WINDOW_WIDTH * C.DECORATION_SIDE_MARGIN_PERCENT)
-        else:  # Правый газон
-            x_min = (self.right_border +
-                     C.WINDOW_WIDTH * C.DECORATION_SIDE_MARGIN_PERCENT)
-            x_max = (C.WINDOW_WIDTH -
-                     C.WINDOW_WIDTH * C.DECORATION_SIDE_MARGIN_PERCENT)
-
-        x = random.uniform(x_min, x_max)
-        y = (spawn_y if spawn_y is not None else
-             random.uniform(C.DECORATION_MIN_Y_SPAWN, 0))
-
-        draw_data = {}
-        # Логика для 'small_stone'
-        if decor_type == 'small_stone':
-            base_size = random.randint(C.SMALL_STONE_SIZE_RANGE[0],
-                                       C.SMALL_STONE_SIZE_RANGE[1])
-            aspect_ratio = random.uniform(
+                obstacle_cls = Manhole
+
+        self.obstacles.add(
+            self.obstacle_pool.acquire(obstacle_cls, lane_x, rng))
+
+    def _update_decoration_spawning(self):
+        """
+        Заполняет газон камнями на DECORATION_LOOKAHEAD пикселей выше
+        экрана, чтобы фон можно было отрисовать заранее. Плотность
+        соответствует одной попытке появления камня на каждый кадр
+        движения с базовой скоростью.
+        """
+        step = C.PLAYER_BASE_SPEED / (C.FPS or C.SIMULATION_RATE)
+        target_y = -self.distance_traveled - C.DECORATION_LOOKAHEAD
+        if self.decoration_frontier_y <= target_y:
+            return
+
+        rng = self.rng.decorations
+        spawn_ys = []
+        frontier_y = self.decoration_frontier_y
+        while frontier_y > target_y:
+            if rng.random() < C.DECORATION_SPAWN_CHANCE_PER_FRAME:
+                spawn_ys.append(rng.uniform(frontier_y - step, frontier_y))
+            frontier_y -= step
+        self.decoration_frontier_y = frontier_y
+
+        # Перевод мировых координат в экранные
+        offset = self.decorations.scroll_offset
+        self._spawn_decorations([y + offset for y in spawn_ys])
+
+    def _spawn_decorations(self, spawn_ys):
+        """Создает пачку камней на газоне на заданных высотах."""
+        rng = self.rng.decorations
+        margin = C.WINDOW_WIDTH * C.DECORATION_SIDE_MARGIN_PERCENT
+        xs = []
+        widths = []
+        heights = []
+        colors = []
+        shadows_x = []
+        shadows_y = []
+
+        for _ in spawn_ys:
+            side = rng.randint(0, 1)
+
+            # Определяем диапазон X-координат для спавна на газоне
+            if side == 0:  # Левый газон
+                x_min = margin
+                x_max = self.left_border - margin
+            else:  # Правый газон
+                x_min = self.right_border + margin
+                x_max = C.WINDOW_WIDTH - margin
+            xs.append(rng.uniform(x_min, x_max))
+
+            base_size = rng.randint(C.SMALL_STONE_SIZE_RANGE[0],
+                                    C.SMALL_STONE_SIZE_RANGE[1])
+            aspect_ratio = rng.uniform(
                 C.SMALL_STONE_ASPECT_RATIO_VARIATION[0],
                 C.SMALL_STONE_ASPECT_RATIO_VARIATION[1])
 
             # Случайно выбираем, будет ли камень шире или выше
-            if random.random() < 0.5:
-                draw_data['stone_width'] = base_size
-                draw_data['stone_height'] = int(base_size * aspect_ratio)
+            if rng.random() < 0.5:
+                widths.append(base_size)
+                heights.append(int(base_size * aspect_ratio))
             else:
-                draw_data['stone_width'] = int(base_size * aspect_ratio)
-                draw_data['stone_height'] = base_size
+                widths.append(int(base_size * aspect_ratio))
+                heights.append(base_size)
 
-            draw_data['stone_color'] = random.choice(C.SMALL_STONE_COLORS)
-            new_decoration = DecorativeElement('small_stone', x, y, draw_data)
+            colors.append(rng.randrange(len(C.SMALL_STONE_COLORS)))
+            shadow_range = C.SMALL_STONE_SHADOW_OFFSET_RANGE
+            shadows_x.append(rng.randint(*shadow_range))
+            shadows_y.append(rng.randint(*shadow_range))
 
-        self.decorations.append(new_decoration)
+        self.decorations.extend(xs, spawn_ys, widths, heights, colors,
+                                shadows_x, shadows_y)
 
     def remove_obstacle(self, obstacle):
-        self.obstacles.remove(obstacle)
-
-    def draw(self, screen):
-        """Отрисовка дороги, разметки, препятствий и декораций."""
-        # Фон (трава)
-        screen.fill(C.COLOR_GREEN_GRASS)
-
-        # Отрисовка декораций
-        for decor in sorted(self.decorations, key=lambda d: d.y):
-            # Максимальная высота маленького камня для корректного
-            # удаления/появления
-            max_decor_height = (max(C.SMALL_STONE_SIZE_RANGE) *
-                                C.SMALL_STONE_ASPECT_RATIO_VARIATION[1])
-            if (decor.y < C.WINDOW_HEIGHT + max_decor_height and
-                    decor.y > C.DECORATION_MIN_Y_SPAWN - max_decor_height):
-                decor.draw(screen)
-
-        # Дорога
-        pygame.draw.rect(screen, C.COLOR_GRAY_ROAD, self.road_rect)
-
-        # Разметка
-        line_x1 = self.left_border + self.road_width / 3
-        line_x2 = self.left_border + self.road_width * 2 / 3
-
-        for y_pos in self.line_y_positions:
-            start_pos1 = (line_x1, y_pos)
-            end_pos1 = (line_x1, y_pos + C.ROAD_LINE_LENGTH)
-            pygame.draw.line(screen, C.COLOR_WHITE, start_pos1, end_pos1,
-                             C.ROAD_LINE_WIDTH)
-
-            start_pos2 = (line_x2, y_pos)
-            end_pos2 = (line_x2, y_pos + C.ROAD_LINE_LENGTH)
-            pygame.draw.line(screen, C.COLOR_WHITE, start_pos2, end_pos2,
-                             C.ROAD_LINE_WIDTH)
+        """Убирает препятствие с дороги, возвращая его в пул."""
+        self.lane_index.remove(obstacle)
+        obstacle.release()
+
+    def get_collision_candidates(self, rect):
+        """Препятствия рядом с rect, с которыми возможно столкновение."""
+        return self.lane_index.candidates(rect)
+
+    def draw(self, screen, alpha=1.0):
+        """
+        Отрисовка дороги, разметки, препятствий и декораций.
+        alpha - доля шага симуляции для интерполяции позиций.
+        """
+        # Газон, камни, дорога и разметка
+        with Profiler.section('draw.road'):
+            self.background.draw(screen,
+                                 self.prev_distance_traveled +
+                                 (self.distance_traveled -
+                                  self.prev_distance_traveled) * alpha)
 
         # Препятствия
-        self.obstacles.draw(screen)
+        with Profiler.section('draw.obstacles'):
+            for obstacle in self.obstacles:
+                screen.blit(obstacle.image,
+                            (obstacle.rect.x,
+                             obstacle.interpolated_y(alpha)))
@@ -1,5 +1,6 @@
 import pygame
 import os
+from collections import OrderedDict
 from .. import constants as C
 
 
@@ -7,14 +8,19 @@ class AssetLoader:
     _images = {}
     _sounds = {}
     _fonts = {}
+    # Отрендеренные строки текста в порядке последнего использования
+    _texts = OrderedDict()
     _is_initialized = False
+    _audio_enabled = True
 
     @staticmethod
-    def initialize():
-        """Инициализирует микшер и шрифты."""
+    def initialize(audio=True):
+        """Инициализирует микшер и шрифты. Без audio звук не проигрывается."""
         if not AssetLoader._is_initialized:
-            pygame.mixer.pre_init(44100, -16, 2, 512)
-            pygame.mixer.init()
+            AssetLoader._audio_enabled = audio
+            if audio:
+                pygame.mixer.pre_init(44100, -16, 2, 512)
+                pygame.mixer.init()
             pygame.font.init()
             AssetLoader._is_initialized = True
 
@@ -54,6 +60,8 @@ class AssetLoader:
     @classmethod
     def get_sound(cls, filename):
         """Загружает и кэширует звуковой эффект."""
+        if not cls._audio_enabled:
+            return None
         if filename in cls._sounds:
             return cls._sounds[filename]
 
@@ -79,6 +87,24 @@ class AssetLoader:
             print(f"Ошибка: не удалось загрузить шрифт '{name}': {e}")
             return pygame.font.Font(None, size)
 
+    @classmethod
+    def render_text(cls, font, text, color, antialias=True):
+        """
+        Рендерит строку шрифтом font с кэшированием. Поверхность
+        общая для всех вызывающих, поэтому изменять ее нельзя.
+        """
+        cache_key = (font, text, tuple(color), antialias)
+        surface = cls._texts.get(cache_key)
+        if surface is not None:
+            cls._texts.move_to_end(cache_key)
+            return surface
+
+        surface = font.render(text, antialias, color)
+        cls._texts[cache_key] = surface
+        if len(cls._texts) > C.TEXT_CACHE_SIZE:
+            cls._texts.popitem(last=False)
+        return surface
+
     @classmethod
     def play_sound(cls, filename):
         """Проигрывает звуковой эффект."""
@@ -89,6 +115,8 @@ class AssetLoader:
     @classmethod
     def play_music(cls, filename, loops=-1):
         """Загружает и проигрывает фоновую музыку."""
+        if not cls._audio_enabled:
+            return
         path = cls._get_path(filename)
         if not os.path.exists(path):
             print(f"Ошибка: файл музыки не найден '{filename}'")
@@ -100,4 +128,5 @@ class AssetLoader:
     @classmethod
     def stop_music(cls):
         """Останавливает воспроизведение музыки."""
-        pygame.mixer.music.stop()
+        if cls._audio_enabled:
+            pygame.mixer.music.stop()
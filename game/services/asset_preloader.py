@@ -0,0 +1,139 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from .. import constants as C
+from .asset_loader import AssetLoader
+
+
+def build_manifest():
+    """
+    Список ресурсов для предзагрузки из констант: изображения IMG_*,
+    звуки SND_* и размеры шрифтов FONT_SIZE_*. Музыка MSC_* читается
+    микшером потоком при воспроизведении, поэтому в манифест не входит.
+    """
+    manifest = []
+    for name, value in vars(C).items():
+        if name.startswith('IMG_'):
+            files = value if isinstance(value, (list, tuple)) else [value]
+            manifest.extend(('image', filename) for filename in files)
+        elif name.startswith('SND_'):
+            manifest.append(('sound', value))
+        elif name.startswith('FONT_SIZE_'):
+            manifest.append(('font', value))
+    # Одинаковые значения у разных констант загружаются один раз
+    return list(dict.fromkeys(manifest))
+
+
+class AssetPreloader:
+    """
+    Загрузка ресурсов манифеста при запуске. Изображения и звуки
+    декодируются в пуле потоков, а в главном потоке poll() переносит
+    готовые ресурсы в кэш AssetLoader (конвертация под формат экрана
+    требует главного потока). Шрифты загружаются в главном потоке.
+    """
+
+    # Время на загрузку шрифтов за один вызов poll(), сек
+    FRAME_BUDGET = 0.008
+
+    def __init__(self, manifest=None, workers=C.ASSET_PRELOAD_WORKERS):
+        self.manifest = build_manifest() if manifest is None else manifest
+        # Время загрузки каждого ресурса в секундах
+        self.timings = {}
+        self.total_time = None
+        self._start = time.perf_counter()
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers or min(8, os.cpu_count() or 1),
+            thread_name_prefix='asset-preload')
+
+        self._pending = {}
+        self._fonts = []
+        for kind, name in self.manifest:
+            if kind == 'font':
+                self._fonts.append(name)
+            elif kind == 'sound' and not AssetLoader._audio_enabled:
+                continue
+            else:
+                future = self._executor.submit(self._decode, kind, name)
+                self._pending[future] = (kind, name)
+        self._count = len(self._pending) + len(self._fonts)
+
+    @staticmethod
+    def _decode(kind, filename):
+        """Чтение и декодирование файла в потоке пула."""
+        start = time.perf_counter()
+        path = AssetLoader._get_path(filename)
+        try:
+            if kind == 'image':
+                asset = pygame.image.load(path)
+            else:
+                asset = pygame.mixer.Sound(path)
+        except (pygame.error, FileNotFoundError):
+            # Ошибку покажет обычная загрузка в главном потоке
+            asset = None
+        return asset, time.perf_counter() - start
+
+    @property
+    def progress(self):
+        """Доля загруженных ресурсов от 0 до 1."""
+        if not self._count:
+            return 1.0
+        return 1.0 - (len(self._pending) + len(self._fonts)) / self._count
+
+    @property
+    def done(self):
+        return not self._pending and not self._fonts
+
+    def poll(self):
+        """
+        Переносит в кэш ресурсы, декодированные с прошлого вызова,
+        и загружает шрифты, пока не истек бюджет кадра.
+        Вызывается из главного потока.
+        """
+        poll_start = time.perf_counter()
+        for future in [future for future in self._pending
+                       if future.done()]:
+            kind, name = self._pending.pop(future)
+            asset, elapsed = future.result()
+            start = time.perf_counter()
+            if asset is None:
+                # Запасная картинка или сообщение об ошибке
+                if kind == 'image':
+                    AssetLoader.get_image(name)
+                else:
+                    AssetLoader.get_sound(name)
+            elif kind == 'image':
+                AssetLoader._images[name] = asset.convert_alpha()
+            else:
+                AssetLoader._sounds[name] = asset
+            self.timings[(kind, name)] = (elapsed + time.perf_counter() -
+                                          start)
+
+        while self._fonts and (time.perf_counter() - poll_start <
+                               self.FRAME_BUDGET):
+            size = self._fonts.pop(0)
+            start = time.perf_counter()
+            AssetLoader.get_font(size)
+            self.timings[('font', size)] = time.perf_counter() - start
+
+        if self.done and self.total_time is None:
+            self.total_time = time.perf_counter() - self._start
+            self._executor.shutdown()
+
+    def cancel(self):
+        """
+        Прерывает загрузку: еще не начатые задачи отменяются,
+        выполняющиеся дожидаются завершения.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._pending.clear()
+        self._fonts.clear()
+
+    def report(self):
+        """Строки отчета: общее время и время каждого ресурса."""
+        lines = [f"Ресурсы загружены за {self.total_time * 1000:.1f} мс "
+                 f"({len(self.timings)} шт.)"]
+        for (kind, name), elapsed in sorted(self.timings.items(),
+                                            key=lambda item: -item[1]):
+            lines.append(f"  {kind:<6} {name!s:<24} {elapsed * 1000:8.2f} мс")
+        return lines
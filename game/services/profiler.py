@@ -0,0 +1,178 @@
+import csv
+import json
+import time
+from collections import deque
+import pygame
+from .. import constants as C
+from .asset_loader import AssetLoader
+
+
+class _Section:
+    """Замер времени участка кода; время суммируется за кадр."""
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        frame = Profiler._frame
+        frame[self.name] = (frame.get(self.name, 0.0) +
+                            time.perf_counter() - self.start)
+        return False
+
+
+class Profiler:
+    """
+    Покадровые замеры времени основного цикла: скользящие средние,
+    99-й перцентиль, график времени кадра и запись в CSV/JSONL.
+    """
+    overlay_visible = False
+
+    _sections = {}
+    _frame = {}
+    _history = {name: deque(maxlen=C.PROFILER_HISTORY)
+                for name in C.PROFILER_SECTIONS}
+    _frame_start = 0.0
+    _frame_index = 0
+
+    _log_file = None
+    _log_writer = None
+
+    _overlay_panel = None
+    _overlay_lines = []
+
+    @classmethod
+    def section(cls, name):
+        """Возвращает контекстный менеджер замера участка name."""
+        section = cls._sections.get(name)
+        if section is None:
+            section = cls._sections[name] = _Section(name)
+        return section
+
+    @classmethod
+    def begin_frame(cls):
+        """Начало кадра."""
+        cls._frame.clear()
+        cls._frame_start = time.perf_counter()
+
+    @classmethod
+    def end_frame(cls):
+        """Конец кадра: сохранение замеров в историю и в журнал."""
+        frame = cls._frame
+        frame['frame'] = time.perf_counter() - cls._frame_start
+        for name in C.PROFILER_SECTIONS:
+            cls._history[name].append(frame.get(name, 0.0) * 1000.0)
+
+        if cls._log_file is not None:
+            cls._write_log_row()
+        cls._frame_index += 1
+
+    @classmethod
+    def toggle_overlay(cls):
+        cls.overlay_visible = not cls.overlay_visible
+
+    @classmethod
+    def stats(cls, name):
+        """Среднее и 99-й перцентиль участка name в мс по истории."""
+        history = cls._history[name]
+        if not history:
+            return 0.0, 0.0
+        ordered = sorted(history)
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        return sum(ordered) / len(ordered), p99
+
+    @classmethod
+    def open_log(cls, path):
+        """Начинает запись замеров каждого кадра в CSV или JSONL."""
+        cls.close_log()
+        cls._log_file = open(path, 'w', newline='')
+        if path.endswith('.csv'):
+            cls._log_writer = csv.writer(cls._log_file)
+            cls._log_writer.writerow(['frame_index'] +
+                                     list(C.PROFILER_SECTIONS))
+        else:
+            cls._log_writer = None
+
+    @classmethod
+    def close_log(cls):
+        if cls._log_file is not None:
+            cls._log_file.close()
+            cls._log_file = None
+            cls._log_writer = None
+
+    @classmethod
+    def _write_log_row(cls):
+        values = [round(cls._history[name][-1], 4)
+                  for name in C.PROFILER_SECTIONS]
+        if cls._log_writer is not None:
+            cls._log_writer.writerow([cls._frame_index] + values)
+        else:
+            row = dict(zip(C.PROFILER_SECTIONS, values))
+            row['frame_index'] = cls._frame_index
+            cls._log_file.write(json.dumps(row) + '\n')
+
+    @classmethod
+    def draw_overlay(cls, screen):
+        """Отрисовка панели замеров и графика времени кадра."""
+        if not cls.overlay_visible:
+            return
+
+        font = AssetLoader.get_font(C.FONT_SIZE_PROFILER)
+        line_height = font.get_linesize()
+        graph_height = 60
+        width = 330
+        height = (len(C.PROFILER_SECTIONS) + 1) * line_height + \
+            graph_height + 20
+
+        if cls._overlay_panel is None:
+            cls._overlay_panel = pygame.Surface((width, height),
+                                                pygame.SRCALPHA)
+            cls._overlay_panel.fill(C.PAUSE_OVERLAY_COLOR)
+
+        # Текст пересчитывается раз в PROFILER_OVERLAY_REFRESH кадров
+        if (not cls._overlay_lines or
+                cls._frame_index % C.PROFILER_OVERLAY_REFRESH == 0):
+            rows = [("участок", "сред., мс", "p99, мс")]
+            for name in C.PROFILER_SECTIONS:
+                avg, p99 = cls.stats(name)
+                rows.append((name, f"{avg:.2f}", f"{p99:.2f}"))
+            # Столбцы: название слева, числа выровнены по правому краю
+            cls._overlay_lines = []
+            for i, row in enumerate(rows):
+                for column, (text, right) in enumerate(
+                        zip(row, (None, 230, 320))):
+                    surf = font.render(text, True, C.COLOR_WHITE)
+                    x_offset = 10 if right is None else \
+                        right - surf.get_width()
+                    cls._overlay_lines.append(
+                        (surf, (x_offset, 5 + i * line_height)))
+
+        x = C.WINDOW_WIDTH - width - 10
+        y = 80
+        screen.blit(cls._overlay_panel, (x, y))
+        for surf, (x_offset, y_offset) in cls._overlay_lines:
+            screen.blit(surf, (x + x_offset, y + y_offset))
+
+        # График времени кадра, линия - бюджет кадра при FPS.
+        # Без ограничения FPS (0) масштаб задает шаг симуляции
+        graph_top = y + height - graph_height - 5
+        graph_bottom = graph_top + graph_height
+        budget_ms = 1000.0 / (C.FPS or C.SIMULATION_RATE)
+        scale = graph_height / (2.0 * budget_ms)
+        if C.FPS:
+            budget_y = graph_bottom - budget_ms * scale
+            pygame.draw.line(screen, C.COLOR_GREEN, (x + 10, budget_y),
+                             (x + width - 10, budget_y))
+
+        history = cls._history['frame']
+        if len(history) > 1:
+            step = (width - 20) / (history.maxlen - 1)
+            points = [(x + 10 + i * step,
+                       max(graph_top, graph_bottom - value * scale))
+                      for i, value in enumerate(history)]
+            pygame.draw.lines(screen, C.COLOR_GOLD, False, points)
@@ -1,24 +1,46 @@
+import atexit
 import json
 import os
+import tempfile
+import threading
+import time
 from .. import constants as C
 
 
 class ProgressManager:
-    """Управление сохранением и загрузкой игрового прогресса."""
+    """
+    Управление сохранением и загрузкой игрового прогресса.
 
-    def __init__(self):
-        self.filepath = os.path.join(C.SAVES_DIR, C.PROGRESS_FILE)
+    Сохранение отложенное: save() запоминает снимок прогресса, а фоновый
+    поток через PROGRESS_SAVE_DELAY записывает последний снимок. Файл
+    пишется во временный, сбрасывается на диск и атомарно заменяет
+    старый, поэтому сбой во время записи не портит прогресс.
+    """
+
+    def __init__(self, persistent=True, filepath=None):
+        self.filepath = filepath or os.path.join(C.SAVES_DIR, C.PROGRESS_FILE)
+        # Без persistent прогресс живет только в памяти (для симуляций)
+        self.persistent = persistent
         self.coins = 0
         self.vehicles = {key: data['price'] == 0
                          for key, data in C.VEHICLES.items()}
         self.current_vehicle = 'bicycle'
-        self._ensure_saves_dir()
-        self.load()
+
+        # Снимок, ожидающий записи, и состояние фонового потока записи
+        self._pending = None
+        self._closed = False
+        self._saver = None
+        self._condition = threading.Condition()
+
+        if self.persistent:
+            self._ensure_saves_dir()
+            self.load()
 
     def _ensure_saves_dir(self):
         """Проверка на существование директории для сохранения прогресса."""
-        if not os.path.exists(C.SAVES_DIR):
-            os.makedirs(C.SAVES_DIR)
+        saves_dir = os.path.dirname(self.filepath)
+        if saves_dir and not os.path.exists(saves_dir):
+            os.makedirs(saves_dir)
 
     def load(self):
         """Загрузка прогресса из JSON-файла."""
@@ -28,30 +50,121 @@ class ProgressManager:
 
         try:
             with open(self.filepath, 'r') as f:
-                data = json.load(f)
-                self.coins = data.get('coins', 0)
-                loaded_vehicles = data.get('vehicles', {})
-                for key in C.VEHICLES:
-                    self.vehicles[key] = loaded_vehicles.get(
-                        key, C.VEHICLES[key]['price'] == 0)
-                self.current_vehicle = data.get('current_vehicle', 'bicycle')
+                self.apply_snapshot(json.load(f))
         except (json.JSONDecodeError, IOError, TypeError) as e:
             print(f"Ошибка загрузки прогресса '{self.filepath}': {e}. "
                   "Создается новый файл.")
             self.reset_and_save()
 
     def save(self):
-        """Сохранение текущего прогресса в JSON-файл."""
-        data = {
+        """
+        Запрос сохранения прогресса. Запись идет в фоновом потоке,
+        несколько запросов подряд дают одну запись последнего снимка.
+        """
+        if not self.persistent:
+            return
+        with self._condition:
+            closed = self._closed
+            if not closed:
+                self._pending = self.snapshot()
+                if self._saver is None:
+                    self._saver = threading.Thread(target=self._save_loop,
+                                                   daemon=True,
+                                                   name='progress-saver')
+                    self._saver.start()
+                    atexit.register(self.close)
+                self._condition.notify_all()
+        if closed:
+            # Поток записи уже остановлен: дожидаемся его последней
+            # записи и сохраняем в вызывающем потоке
+            self._saver.join()
+            self._write(self.snapshot())
+
+    def close(self):
+        """Записывает ожидающее сохранение и останавливает поток записи."""
+        with self._condition:
+            if self._saver is None or self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._saver.join()
+
+    def _save_loop(self):
+        """Цикл фонового потока: запись последнего запрошенного снимка."""
+        condition = self._condition
+        condition.acquire()
+        try:
+            while True:
+                while self._pending is None and not self._closed:
+                    condition.wait()
+                if self._pending is None:
+                    return
+
+                # Изменения в течение задержки попадут в эту же запись
+                deadline = time.monotonic() + C.PROGRESS_SAVE_DELAY
+                while not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    condition.wait(remaining)
+
+                snapshot, self._pending = self._pending, None
+                condition.release()
+                try:
+                    self._write(snapshot)
+                finally:
+                    condition.acquire()
+        finally:
+            condition.release()
+
+    def _write(self, snapshot):
+        """Атомарная запись снимка: временный файл, fsync, переименование."""
+        saves_dir = os.path.dirname(self.filepath) or '.'
+        temp_path = None
+        try:
+            fd, temp_path = tempfile.mkstemp(
+                prefix=os.path.basename(self.filepath) + '.',
+                suffix='.tmp', dir=saves_dir)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(snapshot, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.filepath)
+            temp_path = None
+            self._fsync_dir(saves_dir)
+        except OSError as e:
+            print(f"Ошибка сохранения прогресса '{self.filepath}': {e}")
+        finally:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    @staticmethod
+    def _fsync_dir(path):
+        """Сброс на диск записи каталога о переименовании (не в Windows)."""
+        if not hasattr(os, 'O_DIRECTORY'):
+            return
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def snapshot(self):
+        """Возвращает прогресс в виде словаря."""
+        return {
             'coins': self.coins,
-            'vehicles': self.vehicles,
+            'vehicles': dict(self.vehicles),
             'current_vehicle': self.current_vehicle
         }
-        try:
-            with open(self.filepath, 'w') as f:
-                json.dump(data, f, indent=4)
-        except IOError as e:
-            print(f"Ошибка сохранения прогресса '{self.filepath}': {e}")
+
+    def apply_snapshot(self, data):
+        """Восстанавливает прогресс из словаря, созданного snapshot()."""
+        self.coins = data.get('coins', 0)
+        loaded_vehicles = data.get('vehicles', {})
+        for key in C.VEHICLES:
+            self.vehicles[key] = loaded_vehicles.get(
+                key, C.VEHICLES[key]['price'] == 0)
+        self.current_vehicle = data.get('current_vehicle', 'bicycle')
 
     def reset_and_save(self):
         """Сброс прогресса к значениям по умолчанию и сохранение."""
@@ -0,0 +1,129 @@
+import json
+import struct
+import pygame
+
+
+class ReplayFormat:
+    """
+    Бинарный формат записи ввода.
+
+    Заголовок: сигнатура, версия, зерно сессии и снимок прогресса
+    (монеты, транспорт) в JSON. Далее поток записей фиксированной длины:
+    номер шага симуляции, тип события, зажатые клавиши игрока,
+    код клавиши или кнопки мыши и координаты мыши. Запись END
+    завершает файл и хранит номер последнего шага.
+    """
+    MAGIC = b'FRRP'
+    VERSION = 1
+    HEADER = struct.Struct('<4sHQH')
+    # Зерно сессии хранится в заголовке как беззнаковое 64-битное
+    MAX_SEED = 2 ** 64 - 1
+    RECORD = struct.Struct('<IBBIhh')
+
+    END = 0
+    EVENT_CODES = {
+        pygame.QUIT: 1,
+        pygame.KEYDOWN: 2,
+        pygame.KEYUP: 3,
+        pygame.MOUSEMOTION: 4,
+        pygame.MOUSEBUTTONDOWN: 5,
+        pygame.MOUSEBUTTONUP: 6,
+    }
+    EVENT_TYPES = {code: event_type
+                   for event_type, code in EVENT_CODES.items()}
+
+    HELD_BOOST = 1
+    HELD_BRAKE = 2
+
+
+class ReplayRecorder:
+    """Потоковая запись ввода: каждое событие сразу дописывается в файл."""
+
+    def __init__(self, path, seed, progress_snapshot):
+        self.file = open(path, 'wb')
+        snapshot = json.dumps(progress_snapshot).encode('utf-8')
+        self.file.write(ReplayFormat.HEADER.pack(
+            ReplayFormat.MAGIC, ReplayFormat.VERSION, seed, len(snapshot)))
+        self.file.write(snapshot)
+
+    def record(self, tick, event, held):
+        """Записывает событие, обработанное перед шагом tick."""
+        code = ReplayFormat.EVENT_CODES.get(event.type)
+        if code is None:
+            return
+
+        key = getattr(event, 'key', getattr(event, 'button', 0))
+        x, y = getattr(event, 'pos', (0, 0))
+        held_bits = ((ReplayFormat.HELD_BOOST if held[0] else 0) |
+                     (ReplayFormat.HELD_BRAKE if held[1] else 0))
+        self.file.write(ReplayFormat.RECORD.pack(
+            tick, code, held_bits, key, int(x), int(y)))
+
+    def close(self, tick):
+        """Завершает запись на шаге tick."""
+        if self.file.closed:
+            return
+        self.file.write(ReplayFormat.RECORD.pack(
+            tick, ReplayFormat.END, 0, 0, 0, 0))
+        self.file.close()
+
+
+class ReplayReader:
+    """Потоковое чтение записи ввода по шагам симуляции."""
+
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        header = self.file.read(ReplayFormat.HEADER.size)
+        magic, version, self.seed, snapshot_size = \
+            ReplayFormat.HEADER.unpack(header)
+        if magic != ReplayFormat.MAGIC or version != ReplayFormat.VERSION:
+            raise ValueError(f"'{path}' не является записью Food Rush "
+                             f"версии {ReplayFormat.VERSION}")
+        self.progress_snapshot = json.loads(
+            self.file.read(snapshot_size).decode('utf-8'))
+
+        self.end_tick = None
+        self._pending = self._read_record()
+
+    @property
+    def finished(self):
+        return self._pending is None
+
+    def _read_record(self):
+        data = self.file.read(ReplayFormat.RECORD.size)
+        if len(data) < ReplayFormat.RECORD.size:
+            self.file.close()
+            return None
+        return ReplayFormat.RECORD.unpack(data)
+
+    def events_for_tick(self, tick):
+        """
+        Возвращает список (событие, зажатые клавиши) для шага tick.
+        После записи END возвращает пустой список и finished = True.
+        """
+        events = []
+        while self._pending is not None and self._pending[0] <= tick:
+            record_tick, code, held_bits, key, x, y = self._pending
+            if code == ReplayFormat.END:
+                self.end_tick = record_tick
+                self.file.close()
+                self._pending = None
+                break
+
+            event_type = ReplayFormat.EVENT_TYPES[code]
+            if event_type in (pygame.KEYDOWN, pygame.KEYUP):
+                event = pygame.event.Event(event_type, key=key)
+            elif event_type == pygame.MOUSEMOTION:
+                event = pygame.event.Event(event_type, pos=(x, y))
+            elif event_type in (pygame.MOUSEBUTTONDOWN,
+                                pygame.MOUSEBUTTONUP):
+                event = pygame.event.Event(event_type, button=key,
+                                           pos=(x, y))
+            else:
+                event = pygame.event.Event(event_type)
+
+            held = (bool(held_bits & ReplayFormat.HELD_BOOST),
+                    bool(held_bits & ReplayFormat.HELD_BRAKE))
+            events.append((event, held))
+            self._pending = self._read_record()
+        return events
@@ -0,0 +1,22 @@
+import random
+
+
+class RandomStreams:
+    """
+    Независимые генераторы случайных чисел для подсистем игры.
+    Одинаковое зерно дает одинаковые последовательности в каждой подсистеме,
+    и расход случайных чисел в одной подсистеме не влияет на другие.
+    """
+
+    SUBSYSTEMS = ('traffic', 'decorations', 'orders', 'maze')
+
+    def __init__(self, seed=None):
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """Пересоздает все потоки от зерна seed (или случайного)."""
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        for name in self.SUBSYSTEMS:
+            setattr(self, name, random.Random(f"{seed}:{name}"))
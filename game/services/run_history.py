@@ -0,0 +1,121 @@
+import os
+import sqlite3
+import time
+from .. import constants as C
+
+
+class RunHistory:
+    """
+    История заездов в локальной базе SQLite.
+
+    Заезды только дописываются. Итоги по исходам ведет триггер при
+    вставке, а таблица лидеров читается по индексу, поэтому запросы
+    экрана статистики не зависят от числа сохраненных заездов.
+    """
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY,
+            finished_at REAL NOT NULL,
+            order_name TEXT NOT NULL,
+            route TEXT NOT NULL,
+            vehicle TEXT NOT NULL,
+            outcome TEXT NOT NULL,
+            distance INTEGER NOT NULL,
+            target_distance INTEGER NOT NULL,
+            reward INTEGER NOT NULL,
+            collisions INTEGER NOT NULL,
+            duration REAL NOT NULL,
+            revive_used INTEGER NOT NULL,
+            seed INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS runs_by_duration
+            ON runs (outcome, duration);
+        CREATE INDEX IF NOT EXISTS runs_by_order_duration
+            ON runs (outcome, order_name, route, duration);
+
+        CREATE TABLE IF NOT EXISTS run_totals (
+            outcome TEXT PRIMARY KEY,
+            runs INTEGER NOT NULL,
+            distance INTEGER NOT NULL,
+            reward INTEGER NOT NULL,
+            collisions INTEGER NOT NULL,
+            duration REAL NOT NULL
+        );
+        CREATE TRIGGER IF NOT EXISTS runs_update_totals
+            AFTER INSERT ON runs
+        BEGIN
+            INSERT INTO run_totals
+                VALUES (NEW.outcome, 1, NEW.distance, NEW.reward,
+                        NEW.collisions, NEW.duration)
+            ON CONFLICT (outcome) DO UPDATE SET
+                runs = runs + 1,
+                distance = distance + NEW.distance,
+                reward = reward + NEW.reward,
+                collisions = collisions + NEW.collisions,
+                duration = duration + NEW.duration;
+        END;
+    '''
+
+    FIELDS = ('order_name', 'route', 'vehicle', 'outcome', 'distance',
+              'target_distance', 'reward', 'collisions', 'duration',
+              'revive_used', 'seed')
+
+    def __init__(self, persistent=True, filepath=None):
+        self.filepath = filepath or os.path.join(C.SAVES_DIR, C.HISTORY_FILE)
+        # Без persistent история живет только в памяти (для симуляций)
+        self.persistent = persistent
+        if self.persistent:
+            saves_dir = os.path.dirname(self.filepath)
+            if saves_dir and not os.path.exists(saves_dir):
+                os.makedirs(saves_dir)
+        self.connection = sqlite3.connect(
+            self.filepath if self.persistent else ':memory:')
+        self.connection.row_factory = sqlite3.Row
+        if self.persistent:
+            # Журнал WAL: запись заезда без перезаписи всей базы
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute('PRAGMA synchronous=NORMAL')
+        with self.connection:
+            self.connection.executescript(self.SCHEMA)
+
+    def record(self, **run):
+        """
+        Сохраняет заезд. Ключи - поля FIELDS: outcome - 'delivered',
+        'failed' или 'abandoned' (заезд брошен), reward - полученная
+        награда, duration - время заезда в секундах симуляции;
+        seed можно не передавать.
+        """
+        run.setdefault('seed', None)
+        values = [time.time()] + [run[field] for field in self.FIELDS]
+        with self.connection:
+            self.connection.execute(
+                f"INSERT INTO runs (finished_at, {', '.join(self.FIELDS)}) "
+                f"VALUES ({', '.join('?' * len(values))})", values)
+
+    def totals(self):
+        """Итоги по исходам: {исход: {'runs', 'distance', ...}}."""
+        rows = self.connection.execute('SELECT * FROM run_totals')
+        return {row['outcome']: dict(row) for row in rows}
+
+    def leaderboard(self, order_name=None, route=None, limit=10):
+        """Самые быстрые доставки, при необходимости по заказу и маршруту."""
+        query = "SELECT * FROM runs WHERE outcome = 'delivered'"
+        params = []
+        if order_name is not None:
+            query += " AND order_name = ?"
+            params.append(order_name)
+        if route is not None:
+            query += " AND route = ?"
+            params.append(route)
+        query += " ORDER BY duration LIMIT ?"
+        params.append(limit)
+        return [dict(row) for row in self.connection.execute(query, params)]
+
+    def recent(self, limit=10):
+        """Последние заезды, новые первыми."""
+        return [dict(row) for row in self.connection.execute(
+            'SELECT * FROM runs ORDER BY id DESC LIMIT ?', (limit,))]
+
+    def close(self):
+        self.connection.close()
@@ -4,56 +4,102 @@ from ..services.asset_loader import AssetLoader
 
 
 class HUDView:
-    """Отрисовка HUD: жизни, энергия, расстояние и монеты."""
+    """
+    Отрисовка HUD: жизни, энергия, расстояние и монеты.
+
+    HUD хранится в собственных поверхностях: верхняя панель и полоска
+    энергии. Каждая область перерисовывается, только когда изменились
+    ее входные данные, а в кадре поверхности просто копируются на экран.
+    """
+
+    PANEL_HEIGHT = 70
+    BAR_WIDTH = 300
+    BAR_HEIGHT = 25
 
     def __init__(self):
         self.font_medium = AssetLoader.get_font(C.FONT_SIZE_MEDIUM)
         self.font_small = AssetLoader.get_font(C.FONT_SIZE_SMALL)
         self.life_image = AssetLoader.get_image(C.IMG_LIFE, (30, 30))
 
+        # Верхняя панель: слева расстояние и награда, справа монеты и жизни
+        self.panel = pygame.Surface((C.WINDOW_WIDTH, self.PANEL_HEIGHT))
+        self.panel.fill(C.COLOR_UI_BG)
+        self.left_region = pygame.Rect(0, 0, C.WINDOW_WIDTH // 2,
+                                       self.PANEL_HEIGHT)
+        self.right_region = pygame.Rect(C.WINDOW_WIDTH // 2, 0,
+                                        C.WINDOW_WIDTH - C.WINDOW_WIDTH // 2,
+                                        self.PANEL_HEIGHT)
+
+        # Полоска бонусной энергии снизу, с рамкой в 2px
+        self.bar = pygame.Surface((self.BAR_WIDTH + 4, self.BAR_HEIGHT + 4),
+                                  pygame.SRCALPHA)
+        self.bar_pos = (C.WINDOW_WIDTH / 2 - self.BAR_WIDTH / 2 - 2,
+                        C.WINDOW_HEIGHT - 40 - 2)
+
+        # Значения, по которым области были нарисованы в последний раз
+        self._left_state = None
+        self._right_state = None
+        self._bar_fill = None
+
     def draw(self, screen, player, distance_left, reward, coins):
-        # Панель сверху
-        ui_panel_rect = pygame.Rect(0, 0, C.WINDOW_WIDTH, 70)
-        pygame.draw.rect(screen, C.COLOR_UI_BG, ui_panel_rect)
-
-        # Расстояние и награда
-        dist_text = f"Осталось: {max(0, int(distance_left / 1000))} км"
-        reward_text = f"Награда: {int(reward)}"
-
-        dist_surf = self.font_small.render(dist_text, True, C.COLOR_WHITE)
-        reward_surf = self.font_small.render(reward_text, True, C.COLOR_GOLD)
-
-        screen.blit(dist_surf, (20, 10))
-        screen.blit(reward_surf, (20, 35))
-
-        # Монеты
-        coins_text = f"Монеты: {coins}"
-        coins_surf = self.font_small.render(coins_text, True, C.COLOR_GOLD)
-        screen.blit(coins_surf,
-                    coins_surf.get_rect(right=C.WINDOW_WIDTH - 20, top=10))
-
-        # Жизни
-        for i in range(player.lives):
-            screen.blit(self.life_image,
-                        (C.WINDOW_WIDTH - 30 - 10 - i * 35, 35))
-
-        # Полоска бонусной энергии снизу
-        self._draw_bar(screen, C.WINDOW_WIDTH/2 - 150, C.WINDOW_HEIGHT-40,
-                       300, 25, player.energy / C.PLAYER_MAX_ENERGY,
-                       C.COLOR_BLUE, "Энергия")
-
-    def _draw_bar(self, screen, x, y, w, h, percent, color, label):
-        """Вспомогательный метод для отрисовки полосок."""
-        if percent < 0:
-            percent = 0
-        if percent > 1:
-            percent = 1
-
-        bg_rect = pygame.Rect(x-2, y-2, w+4, h+4)
-        pygame.draw.rect(screen, C.COLOR_UI_BG, bg_rect, border_radius=7)
-
-        fill_rect = pygame.Rect(x, y, int(w * percent), h)
-        pygame.draw.rect(screen, color, fill_rect, border_radius=5)
-
-        label_surf = self.font_small.render(label, True, C.COLOR_WHITE)
-        screen.blit(label_surf, label_surf.get_rect(center=bg_rect.center))
+        left_state = (max(0, int(distance_left / 1000)), int(reward))
+        if left_state != self._left_state:
+            self._left_state = left_state
+            self._redraw_left(*left_state)
+
+        right_state = (coins, player.lives)
+        if right_state != self._right_state:
+            self._right_state = right_state
+            self._redraw_right(*right_state)
+
+        percent = min(1, max(0, player.energy / C.PLAYER_MAX_ENERGY))
+        bar_fill = int(self.BAR_WIDTH * percent)
+        if bar_fill != self._bar_fill:
+            self._bar_fill = bar_fill
+            self._redraw_bar(bar_fill, C.COLOR_BLUE, "Энергия")
+
+        screen.blit(self.panel, (0, 0))
+        screen.blit(self.bar, self.bar_pos)
+
+    def _redraw_left(self, distance_km, reward):
+        """Расстояние и награда."""
+        self.panel.fill(C.COLOR_UI_BG, self.left_region)
+
+        dist_surf = AssetLoader.render_text(
+            self.font_small, f"Осталось: {distance_km} км", C.COLOR_WHITE)
+        reward_surf = AssetLoader.render_text(
+            self.font_small, f"Награда: {reward}", C.COLOR_GOLD)
+
+        self.panel.blit(dist_surf, (20, 10))
+        self.panel.blit(reward_surf, (20, 35))
+
+    def _redraw_right(self, coins, lives):
+        """Монеты и жизни."""
+        self.panel.fill(C.COLOR_UI_BG, self.right_region)
+
+        coins_surf = AssetLoader.render_text(self.font_small,
+                                             f"Монеты: {coins}",
+                                             C.COLOR_GOLD)
+        self.panel.blit(coins_surf,
+                        coins_surf.get_rect(right=C.WINDOW_WIDTH - 20,
+                                            top=10))
+
+        for i in range(lives):
+            self.panel.blit(self.life_image,
+                            (C.WINDOW_WIDTH - 30 - 10 - i * 35, 35))
+
+    def _redraw_bar(self, fill_width, color, label):
+        """Перерисовка полоски с заполнением fill_width пикселей."""
+        self.bar.fill((0, 0, 0, 0))
+
+        bg_rect = self.bar.get_rect()
+        # Без альфы, как при рисовании прямо на экране
+        pygame.draw.rect(self.bar, C.COLOR_UI_BG[:3], bg_rect,
+                         border_radius=7)
+
+        fill_rect = pygame.Rect(2, 2, fill_width, self.BAR_HEIGHT)
+        pygame.draw.rect(self.bar, color, fill_rect, border_radius=5)
+
+        label_surf = AssetLoader.render_text(self.font_small, label,
+                                             C.COLOR_WHITE)
+        self.bar.blit(label_surf, label_surf.get_rect(center=bg_rect.center))
@@ -0,0 +1,29 @@
+import pygame
+from .. import constants as C
+from ..services.asset_loader import AssetLoader
+
+
+class LoadingView:
+    """Экран загрузки ресурсов с полоской прогресса."""
+
+    BAR_WIDTH = 400
+    BAR_HEIGHT = 20
+
+    def __init__(self):
+        font = AssetLoader.get_font(C.FONT_SIZE_MEDIUM)
+        self.text_surf = AssetLoader.render_text(font, "Загрузка...",
+                                                 C.COLOR_WHITE)
+        self.bar_rect = pygame.Rect(0, 0, self.BAR_WIDTH, self.BAR_HEIGHT)
+        self.bar_rect.center = (C.WINDOW_WIDTH / 2, C.WINDOW_HEIGHT / 2 + 40)
+
+    def draw(self, screen, progress):
+        """Отрисовка экрана; progress - доля загруженного от 0 до 1."""
+        screen.fill(C.COLOR_UI_BG)
+        screen.blit(self.text_surf,
+                    self.text_surf.get_rect(centerx=C.WINDOW_WIDTH / 2,
+                                            bottom=self.bar_rect.top - 15))
+        pygame.draw.rect(screen, C.BUTTON_COLOR, self.bar_rect,
+                         border_radius=5)
+        fill_rect = self.bar_rect.copy()
+        fill_rect.width = int(self.BAR_WIDTH * progress)
+        pygame.draw.rect(screen, C.COLOR_GREEN, fill_rect, border_radius=5)
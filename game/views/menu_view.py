@@ -13,15 +13,30 @@ class Button:
         self.action = action
         self.disabled = disabled
         self.is_hovered = False
+        # Цвет, которым кнопка нарисована на экране в последний раз
+        self.drawn_color = None
+
+    @property
+    def color(self):
+        return (C.BUTTON_DISABLED_COLOR if self.disabled else
+                (C.BUTTON_HOVER_COLOR if self.is_hovered else C.BUTTON_COLOR))
+
+    @property
+    def is_dirty(self):
+        """Изменился ли вид кнопки с последней отрисовки."""
+        return self.color != self.drawn_color
 
     def draw(self, screen):
-        color = (C.BUTTON_DISABLED_COLOR if self.disabled else
-                 (C.BUTTON_HOVER_COLOR if self.is_hovered else C.BUTTON_COLOR))
-        pygame.draw.rect(screen, color, self.rect, border_radius=10)
+        """Отрисовка кнопки. Возвращает занятую ей область экрана."""
+        self.drawn_color = self.color
+        pygame.draw.rect(screen, self.drawn_color, self.rect,
+                         border_radius=10)
 
-        text_surf = self.font.render(self.text, True, C.COLOR_WHITE)
+        text_surf = AssetLoader.render_text(self.font, self.text,
+                                            C.COLOR_WHITE)
         text_rect = text_surf.get_rect(center=self.rect.center)
         screen.blit(text_surf, text_rect)
+        return self.rect.union(text_rect)
 
     def handle_event(self, event):
         """Обработка событий для кнопки."""
@@ -31,7 +46,7 @@ class Button:
             self.is_hovered = self.rect.collidepoint(event.pos)
         if event.type == pygame.MOUSEBUTTONDOWN and \
            event.button == 1 and self.is_hovered:
-            AssetLoader.play_sound('click.wav')
+            AssetLoader.play_sound(C.SND_CLICK)
             return self.action
         return None
 
@@ -39,9 +54,10 @@ class Button:
 class MenuView:
     """Обработка отображения различных меню игры."""
 
-    def __init__(self, progress_manager, order_manager):
+    def __init__(self, progress_manager, order_manager, run_history=None):
         self.progress = progress_manager
         self.orders = order_manager
+        self.history = run_history
         self.state = 'main'
         self.background = AssetLoader.get_image(C.IMG_BACKGROUND,
                                                 (C.WINDOW_WIDTH,
@@ -54,12 +70,19 @@ class MenuView:
 
         self.ui_elements = {}
         self.game_over_text = None
+        # Строки экрана статистики, читаются из истории при входе в него
+        self.stats_lines = []
+        # Экран целиком перерисовывается при смене меню и монет,
+        # а между ними - только кнопки, у которых сменился вид
+        self.needs_full_redraw = True
+        self._drawn_coins = None
         self._set_state('main')
 
     def _set_state(self, new_state, revive_available=False):
         """Установка текущего состояния меню и генерация его элементов."""
         self.state = new_state
         self.ui_elements.clear()
+        self.needs_full_redraw = True
 
         if self.state == 'main':
             self._create_main_menu()
@@ -71,18 +94,43 @@ class MenuView:
             self._create_route_menu()
         elif self.state == 'game_over':
             self._create_game_over_menu(revive_available)
+        elif self.state == 'stats':
+            self._create_stats_menu()
 
     def _create_main_menu(self):
         """Создание кнопок для главного меню."""
-        self.ui_elements['btn_start'] = Button(
-            (C.WINDOW_WIDTH/2 - 150, 300, 300, 70), "Начать",
-            self.font_reg, 'go_to_orders')
-        self.ui_elements['btn_shop'] = Button(
-            (C.WINDOW_WIDTH/2 - 150, 400, 300, 70), "Магазин",
-            self.font_reg, 'go_to_shop')
-        self.ui_elements['btn_quit'] = Button(
-            (C.WINDOW_WIDTH/2 - 150, 500, 300, 70), "Выход",
-            self.font_reg, 'quit')
+        buttons = [("Начать", 'go_to_orders'), ("Магазин", 'go_to_shop'),
+                   ("Выход", 'quit')]
+        if self.history is not None:
+            buttons.insert(2, ("Статистика", 'go_to_stats'))
+        top = 300 if len(buttons) == 3 else 250
+        for i, (text, action) in enumerate(buttons):
+            self.ui_elements[f'btn_{action}'] = Button(
+                (C.WINDOW_WIDTH/2 - 150, top + i * 100, 300, 70), text,
+                self.font_reg, action)
+
+    def _create_stats_menu(self):
+        """Чтение итогов и лучших доставок из истории заездов."""
+        totals = self.history.totals()
+        delivered = totals.get('delivered', {})
+        runs = sum(row['runs'] for row in totals.values())
+        self.stats_lines = [
+            f"Заездов: {runs}, доставлено: {delivered.get('runs', 0)}",
+            f"Заработано монет: {delivered.get('reward', 0)}, "
+            f"проехано: "
+            f"{sum(row['distance'] for row in totals.values()) / 1000:.1f} км",
+            "Быстрые доставки:",
+        ]
+        route_names = {'short': "короткий", 'long': "длинный"}
+        for i, run in enumerate(self.history.leaderboard(limit=5)):
+            self.stats_lines.append(
+                f"{i + 1}. {run['order_name']} "
+                f"({route_names.get(run['route'], run['route'])}) - "
+                f"{run['duration']:.1f} c")
+
+        self.ui_elements['btn_back'] = Button(
+            (C.WINDOW_WIDTH/2-125, 600, 250, 60), "Назад",
+            self.font_reg, 'go_to_main')
 
     def _create_shop_menu(self):
         """Создание кнопок для магазина транспорта."""
@@ -123,11 +171,17 @@ class MenuView:
             route_button_width = 450
             route_button_height = 120
 
-            dist_short = int(base_distance * 0.7)
-            reward_short = int(base_reward * 2.0)
+            short_route = C.ROUTE_PARAMETERS['short']
+            dist_short = int(base_distance *
+                             short_route['distance_multiplier'])
+            reward_short = int(base_reward *
+                               short_route['reward_multiplier'])
 
-            dist_long = int(base_distance * 1.5)
-            reward_long = int(base_reward * 1.0)
+            long_route = C.ROUTE_PARAMETERS['long']
+            dist_long = int(base_distance *
+                            long_route['distance_multiplier'])
+            reward_long = int(base_reward *
+                              long_route['reward_multiplier'])
 
             self.ui_elements['btn_short'] = Button(
                 (C.WINDOW_WIDTH/2 - route_button_width - 20,
@@ -198,6 +252,8 @@ class MenuView:
             self._set_state('shop')
         if action == 'go_to_orders':
             self._set_state('orders')
+        if action == 'go_to_stats':
+            self._set_state('stats')
 
         if action.startswith('select_'):
             key = action.split('_')[1]
@@ -223,39 +279,63 @@ class MenuView:
 
         return None
 
-    def draw(self, screen):
-        """Отрисовка текущего меню на экране."""
+    def draw(self, screen, full=True):
+        """
+        Отрисовка текущего меню на экране. Без full перерисовываются
+        только изменившиеся кнопки. Возвращает список изменившихся
+        областей экрана.
+        """
+        if (full or self.needs_full_redraw or
+                self._drawn_coins != self.progress.coins):
+            self._draw_full(screen)
+            return [screen.get_rect()]
+
+        dirty = []
+        for element in self.ui_elements.values():
+            if isinstance(element, Button) and element.is_dirty:
+                # Под скругленными углами кнопки остается фон
+                screen.blit(self.background, element.rect, element.rect)
+                dirty.append(element.draw(screen))
+        return dirty
+
+    def _draw_full(self, screen):
+        """Отрисовка всего меню."""
+        self.needs_full_redraw = False
+        self._drawn_coins = self.progress.coins
         screen.blit(self.background, (0, 0))
 
         if self.state not in ['game_over']:
-            title_surf = self.font_title.render(C.GAME_TITLE,
-                                                True, C.COLOR_WHITE)
+            title_surf = AssetLoader.render_text(
+                self.font_title, C.GAME_TITLE, C.COLOR_WHITE)
             screen.blit(title_surf,
                         title_surf.get_rect(centerx=C.WINDOW_WIDTH/2, y=50))
 
-            coins_surf = self.font_reg.render(f"Монеты: {self.progress.coins}",
-                                              True, C.COLOR_GOLD)
+            coins_surf = AssetLoader.render_text(
+                self.font_reg, f"Монеты: {self.progress.coins}", C.COLOR_GOLD)
             screen.blit(coins_surf,
                         coins_surf.get_rect(right=C.WINDOW_WIDTH-20, top=20))
 
         if self.state == 'shop':
             self._draw_shop_details(screen)
         elif self.state == 'orders':
-            order_title_surf = self.font_reg.render("Выберите заказ:",
-                                                    True, C.COLOR_WHITE)
+            order_title_surf = AssetLoader.render_text(
+                self.font_reg, "Выберите заказ:", C.COLOR_WHITE)
             screen.blit(order_title_surf,
                         order_title_surf.get_rect(centerx=C.WINDOW_WIDTH/2,
                                                   y=180))
         elif self.state == 'route':
             self._draw_route_details(screen)
+        elif self.state == 'stats':
+            self._draw_stats(screen)
         elif self.state == 'game_over':
             if self.game_over_text:
                 text_rect = self.game_over_text.get_rect(
                     center=(C.WINDOW_WIDTH/2, C.WINDOW_HEIGHT/2 - 150))
                 screen.blit(self.game_over_text, text_rect)
 
-            coins_surf = self.font_reg.render(
-                f"Итого монет: {self.progress.coins}", True, C.COLOR_GOLD)
+            coins_surf = AssetLoader.render_text(
+                self.font_reg, f"Итого монет: {self.progress.coins}",
+                C.COLOR_GOLD)
             screen.blit(coins_surf,
                         coins_surf.get_rect(centerx=C.WINDOW_WIDTH/2,
                                             y=C.WINDOW_HEIGHT/2 - 100))
@@ -268,7 +348,8 @@ class MenuView:
         """Отрисовка деталей магазина."""
         start_x = C.WINDOW_WIDTH/2 - (len(C.VEHICLES) * 300 - 50) / 2
         for i, (key, data) in enumerate(C.VEHICLES.items()):
-            name_surf = self.font_med.render(data['name'], True, C.COLOR_WHITE)
+            name_surf = AssetLoader.render_text(self.font_med, data['name'],
+                                                C.COLOR_WHITE)
             screen.blit(name_surf,
                         name_surf.get_rect(centerx=start_x + i*300 + 125,
                                            y=300))
@@ -277,7 +358,16 @@ class MenuView:
         """Отрисовка деталей выбора маршрута."""
         if self.orders.selected_order:
             order_name = self.orders.selected_order.name
-            title = self.font_reg.render(f"Заказ: {order_name}", True,
-                                         C.COLOR_WHITE)
+            title = AssetLoader.render_text(
+                self.font_reg, f"Заказ: {order_name}", C.COLOR_WHITE)
             screen.blit(title,
                         title.get_rect(centerx=C.WINDOW_WIDTH/2, y=200))
+
+    def _draw_stats(self, screen):
+        """Отрисовка статистики заездов."""
+        for i, line in enumerate(self.stats_lines):
+            line_surf = AssetLoader.render_text(self.font_med, line,
+                                                C.COLOR_WHITE)
+            screen.blit(line_surf,
+                        line_surf.get_rect(centerx=C.WINDOW_WIDTH/2,
+                                           y=170 + i * 45))
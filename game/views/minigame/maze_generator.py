@@ -1,106 +1,467 @@
 import random
 import heapq
+from array import array
+
+
+class MazeGrid:
+    """
+    Лабиринт в плоском bytearray: 1 - стена, 0 - проход.
+    grid[r][c] читает клетку, как у списка списков.
+    """
+    __slots__ = ('rows', 'cols', 'cells', '_view')
+
+    def __init__(self, rows, cols, fill=1):
+        self.rows = rows
+        self.cols = cols
+        self.cells = bytearray([fill]) * (rows * cols)
+        self._view = memoryview(self.cells)
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, r):
+        """Строка r без копирования."""
+        if not 0 <= r < self.rows:
+            raise IndexError(r)
+        return self._view[r * self.cols:(r + 1) * self.cols]
+
+    def __iter__(self):
+        for r in range(self.rows):
+            yield self[r]
 
 
 class MazeGenerator:
-    """Генерация лабиринта, используя алгоритм рекурсивного возврата."""
+    """
+    Генерация лабиринта. Клетки лабиринта лежат на нечетных
+    строках и столбцах, стены между ними - на четных.
+
+    Алгоритмы:
+    backtracker - рекурсивный возврат (длинные извилистые коридоры);
+    eller - алгоритм Эллера, идет по строкам и хранит только одну строку;
+    wilson - алгоритм Уилсона, равновероятный выбор из всех лабиринтов.
+    """
 
-    def __init__(self, rows, cols):
+    ALGORITHMS = ('backtracker', 'eller', 'wilson')
+
+    def __init__(self, rows, cols, rng=None, algorithm='backtracker'):
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Неизвестный алгоритм лабиринта '{algorithm}'")
+        self.rng = rng or random.Random()
+        self.algorithm = algorithm
         self.rows = rows if rows % 2 != 0 else rows + 1
         self.cols = cols if cols % 2 != 0 else cols + 1
-        self.maze = [[1 for _ in range(self.cols)]
-                     for _ in range(self.rows)]
+        # Сетка клеток без стен: клетка (y, x) - это (2y+1, 2x+1) лабиринта
+        self.cell_rows = (self.rows - 1) // 2
+        self.cell_cols = (self.cols - 1) // 2
+        self.maze = MazeGrid(self.rows, self.cols)
 
     def generate(self):
         """Основной метод для генерации лабиринта."""
-        stack = [(1, 1)]
-        self.maze[1][1] = 0
+        getattr(self, '_generate_' + self.algorithm)()
+
+        # Создние входа и выхода
+        cells = self.maze.cells
+        cells[self.cols] = 0
+        cells[(self.rows - 1) * self.cols - 1] = 0
+
+        return self.maze
+
+    def _carve(self, y, x):
+        """Открывает клетку (y, x)."""
+        self.maze.cells[(2 * y + 1) * self.cols + 2 * x + 1] = 0
+
+    def _carve_between(self, y, x, ny, nx):
+        """Открывает соседнюю клетку (ny, nx) и стену до нее."""
+        cells = self.maze.cells
+        cells[(2 * ny + 1) * self.cols + 2 * nx + 1] = 0
+        cells[(y + ny + 1) * self.cols + x + nx + 1] = 0
 
+    def _generate_backtracker(self):
+        """
+        Рекурсивный возврат на стеке. Посещенные клетки хранятся в сетке
+        с шагом строки cols, окруженной рамкой из посещенных клеток:
+        соседей не нужно проверять на выход за границы, а клетка i
+        сетки - это клетка 2*i - cols - 1 лабиринта.
+        """
+        cols = self.cols
+        if not self.cell_rows or not self.cell_cols:
+            return
+        visited = bytearray([1]) * (cols * (self.cell_rows + 2))
+        for y in range(1, self.cell_rows + 1):
+            visited[y * cols + 1:y * cols + 1 + self.cell_cols] = \
+                bytes(self.cell_cols)
+
+        cells = self.maze.cells
+        choice = self.rng.choice
+        offset = cols + 1
+
+        current = cols + 1
+        visited[current] = 1
+        cells[2 * current - offset] = 0
+        stack = [current]
+        push = stack.append
         while stack:
-            r, c = stack[-1]
+            current = stack[-1]
+            # Порядок соседей: вправо, влево, вниз, вверх
             neighbors = []
-            for dr, dc in [(0, 2), (0, -2), (2, 0), (-2, 0)]:
-                nr, nc = r + dr, c + dc
-                if (0 < nr < self.rows - 1 and
-                        0 < nc < self.cols - 1 and self.maze[nr][nc] == 1):
-                    neighbors.append((nr, nc))
+            if not visited[current + 1]:
+                neighbors.append(current + 1)
+            if not visited[current - 1]:
+                neighbors.append(current - 1)
+            if not visited[current + cols]:
+                neighbors.append(current + cols)
+            if not visited[current - cols]:
+                neighbors.append(current - cols)
 
             if neighbors:
-                next_r, next_c = random.choice(neighbors)
-                # Убираем стену между текущей и следующей ячейкой
-                self.maze[r + (next_r - r) // 2][c + (next_c - c) // 2] = 0
-                self.maze[next_r][next_c] = 0
-                stack.append((next_r, next_c))
+                following = choice(neighbors)
+                visited[following] = 1
+                # Стена между клетками и следующая клетка
+                cells[current + following - offset] = 0
+                cells[2 * following - offset] = 0
+                push(following)
             else:
                 stack.pop()
 
-        # Создние входа и выхода
-        self.maze[1][0] = 0
-        self.maze[self.rows-2][self.cols-1] = 0
+    def _generate_eller(self):
+        """
+        Алгоритм Эллера. Для текущей строки хранятся только номера
+        множеств клеток, поэтому память - O(ширины).
+        """
+        rng = self.rng
+        cells = self.maze.cells
+        width = self.cell_cols
+        if not self.cell_rows or not width:
+            return
+        row = [None] * width
+        next_set = 0
+
+        for y in range(self.cell_rows):
+            last_row = y == self.cell_rows - 1
+            members = {}
+            for x in range(width):
+                if row[x] is None:
+                    row[x] = next_set
+                    next_set += 1
+                members.setdefault(row[x], []).append(x)
+            # Все клетки строки открываются одним срезом
+            start = (2 * y + 1) * self.cols + 1
+            cells[start:start + 2 * width:2] = bytes(width)
+
+            # Объединение соседних клеток из разных множеств
+            for x in range(width - 1):
+                a, b = row[x], row[x + 1]
+                if a != b and (last_row or rng.random() < 0.5):
+                    self._carve_between(y, x, y, x + 1)
+                    if len(members[a]) < len(members[b]):
+                        a, b = b, a
+                    for member in members[b]:
+                        row[member] = a
+                    members[a].extend(members.pop(b))
+
+            if last_row:
+                break
+
+            # Каждое множество хотя бы одной клеткой уходит вниз
+            next_row = [None] * width
+            for set_id, xs in members.items():
+                down = [x for x in xs if rng.random() < 0.5]
+                if not down:
+                    down = [rng.choice(xs)]
+                for x in down:
+                    self._carve_between(y, x, y + 1, x)
+                    next_row[x] = set_id
+            row = next_row
+
+    def _generate_wilson(self):
+        """
+        Алгоритм Уилсона: случайные блуждания со стиранием петель
+        от каждой клетки вне лабиринта до уже построенной части.
+        """
+        rng = self.rng
+        rows, width = self.cell_rows, self.cell_cols
+        total = rows * width
+        if not total:
+            return
+        in_maze = bytearray(total)
+        # Направление выхода из клетки при текущем блуждании
+        exits = [0] * total
+
+        first = rng.randrange(total)
+        in_maze[first] = 1
+        self._carve(*divmod(first, width))
+
+        for start in range(total):
+            if in_maze[start]:
+                continue
+            current = start
+            while not in_maze[current]:
+                y, x = divmod(current, width)
+                neighbors = []
+                if x + 1 < width:
+                    neighbors.append(current + 1)
+                if x > 0:
+                    neighbors.append(current - 1)
+                if y + 1 < rows:
+                    neighbors.append(current + width)
+                if y > 0:
+                    neighbors.append(current - width)
+                following = rng.choice(neighbors)
+                exits[current] = following
+                current = following
+
+            # Проход по последним направлениям стирает петли
+            current = start
+            self._carve(*divmod(start, width))
+            while not in_maze[current]:
+                in_maze[current] = 1
+                following = exits[current]
+                self._carve_between(*divmod(current, width),
+                                    *divmod(following, width))
+                current = following
+
+
+def flat_cells(maze):
+    """Клетки лабиринта (MazeGrid или список списков) плоским буфером."""
+    if isinstance(maze, MazeGrid):
+        return maze.cells
+    return bytes(value for row in maze for value in row)
 
-        return self.maze
+
+def is_open(cells, cols, pos):
+    """Является ли клетка pos = (r, c) проходом внутри лабиринта."""
+    r, c = pos
+    return (0 <= c < cols and 0 <= r * cols + c < len(cells) and
+            cells[r * cols + c] == 0)
+
+
+def open_neighbors(cells, cols, index):
+    """Плоские индексы проходимых соседей клетки index."""
+    c = index % cols
+    neighbors = []
+    if c + 1 < cols and not cells[index + 1]:
+        neighbors.append(index + 1)
+    if c > 0 and not cells[index - 1]:
+        neighbors.append(index - 1)
+    if index + cols < len(cells) and not cells[index + cols]:
+        neighbors.append(index + cols)
+    if index >= cols and not cells[index - cols]:
+        neighbors.append(index - cols)
+    return neighbors
 
 
 class AStarPathfinder:
-    """Нахождение кратчайшего пути в лабиринте с помощью алгоритма A*."""
+    """
+    Нахождение кратчайшего пути в лабиринте.
+
+    Режимы:
+    astar - A* с манхэттенской эвристикой;
+    bfs - поиск в ширину, для сетки с единичной ценой шага;
+    bidirectional - поиск в ширину одновременно от начала и от конца.
+
+    Клетки нумеруются плоским индексом r * cols + c, оценки и предки
+    хранятся в массивах по этому индексу.
+    """
+
+    MODES = ('astar', 'bfs', 'bidirectional')
 
     def __init__(self, maze):
         self.maze = maze
         self.rows = len(maze)
         self.cols = len(maze[0])
+        self.cells = flat_cells(maze)
 
-    def find_path(self, start, end):
-        """Нахождение пути от начальной точки до конечной."""
-        open_set = []
-        heapq.heappush(open_set, (0, start))
+    def find_path(self, start, end, mode='astar'):
+        """
+        Нахождение пути от начальной точки до конечной.
+        Возвращает список клеток (r, c) от start до end или None.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Неизвестный режим поиска пути '{mode}'")
+        if not (is_open(self.cells, self.cols, start) and
+                is_open(self.cells, self.cols, end)):
+            return None
 
-        came_from = {}
-        g_score = {(r, c): float('inf')
-                   for r in range(self.rows) for c in range(self.cols)}
-        g_score[start] = 0
-        f_score = {(r, c): float('inf')
-                   for r in range(self.rows) for c in range(self.cols)}
-        f_score[start] = self._heuristic(start, end)
+        start_index = start[0] * self.cols + start[1]
+        end_index = end[0] * self.cols + end[1]
+        if start_index == end_index:
+            return [start]
 
-        while open_set:
-            _, current = heapq.heappop(open_set)
+        if mode == 'astar':
+            came_from = self._astar(start_index, end_index)
+        elif mode == 'bfs':
+            came_from = self._bfs(start_index, end_index)
+        else:
+            return self._bidirectional(start_index, end_index)
+        if came_from is None:
+            return None
+        return self._reconstruct_path(came_from, end_index)
 
-            if current == end:
-                return self._reconstruct_path(came_from, current)
+    def _astar(self, start, end):
+        """
+        A* с отложенным удалением: устаревшие записи кучи пропускаются
+        при извлечении по закрытому множеству. При равной оценке первой
+        извлекается клетка ближе к цели.
+        """
+        cols = self.cols
+        end_r, end_c = divmod(end, cols)
+        cells = self.cells
+        size = len(cells)
+        g_score = array('l', [-1]) * size
+        came_from = array('l', [-1]) * size
+        closed = bytearray(size)
+        heappush, heappop = heapq.heappush, heapq.heappop
 
-            for neighbor in self._get_neighbors(current):
-                tentative_g_score = g_score[current] + 1
+        r, c = divmod(start, cols)
+        h = abs(r - end_r) + abs(c - end_c)
+        g_score[start] = 0
+        open_set = [(h, h, start)]
+        while open_set:
+            _, _, current = heappop(open_set)
+            if closed[current]:
+                continue
+            if current == end:
+                return came_from
+            closed[current] = 1
 
-                if tentative_g_score < g_score[neighbor]:
-                    came_from[neighbor] = current
+            tentative_g_score = g_score[current] + 1
+            for neighbor in open_neighbors(cells, cols, current):
+                if closed[neighbor]:
+                    continue
+                g = g_score[neighbor]
+                if g < 0 or tentative_g_score < g:
                     g_score[neighbor] = tentative_g_score
-                    f_score[neighbor] = (g_score[neighbor] +
-                                         self._heuristic(neighbor, end))
-                    if neighbor not in [item[1] for item in open_set]:
-                        heapq.heappush(open_set, (f_score[neighbor], neighbor))
+                    came_from[neighbor] = current
+                    r, c = divmod(neighbor, cols)
+                    h = abs(r - end_r) + abs(c - end_c)
+                    heappush(open_set, (tentative_g_score + h, h, neighbor))
+        return None
 
+    def _bfs(self, start, end):
+        """Поиск в ширину по очереди с массивом предков."""
+        cells, cols = self.cells, self.cols
+        came_from = array('l', [-1]) * len(cells)
+        came_from[start] = start
+        frontier = [start]
+        while frontier:
+            following = []
+            for current in frontier:
+                for neighbor in open_neighbors(cells, cols, current):
+                    if came_from[neighbor] < 0:
+                        came_from[neighbor] = current
+                        if neighbor == end:
+                            return came_from
+                        following.append(neighbor)
+            frontier = following
         return None
 
-    def _heuristic(self, a, b):
-        """Манхэттенское расстояние."""
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-    def _get_neighbors(self, pos):
-        """Возвращение списка соседних проходимых ячеек."""
-        r, c = pos
-        neighbors = []
-        for dr, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            nr, nc = r + dr, c + dc
-            if (0 <= nr < self.rows and
-                    0 <= nc < self.cols and self.maze[nr][nc] == 0):
-                neighbors.append((nr, nc))
-        return neighbors
+    def _bidirectional(self, start, end):
+        """
+        Поиск в ширину от обоих концов: каждый раз расширяется меньший
+        фронт, пока фронты не встретятся.
+        """
+        cells, cols = self.cells, self.cols
+        size = len(cells)
+        # Предки от начала и потомки к концу
+        forward = array('l', [-1]) * size
+        backward = array('l', [-1]) * size
+        forward[start] = start
+        backward[end] = end
+        front, back = [start], [end]
+        while front and back:
+            expand_forward = len(front) <= len(back)
+            frontier = front if expand_forward else back
+            parents, others = ((forward, backward) if expand_forward else
+                               (backward, forward))
+            following = []
+            for current in frontier:
+                for neighbor in open_neighbors(cells, cols, current):
+                    if parents[neighbor] >= 0:
+                        continue
+                    parents[neighbor] = current
+                    if others[neighbor] >= 0:
+                        return self._join_paths(forward, backward, neighbor)
+                    following.append(neighbor)
+            if expand_forward:
+                front = following
+            else:
+                back = following
+        return None
+
+    def _join_paths(self, forward, backward, meeting):
+        """Склейка половин пути, встретившихся в клетке meeting."""
+        path = self._reconstruct_path(forward, meeting)
+        current = meeting
+        while backward[current] != current:
+            current = backward[current]
+            path.append(divmod(current, self.cols))
+        return path
 
     def _reconstruct_path(self, came_from, current):
         """Восстановление пути от конца к началу."""
-        path = [current]
-        while current in came_from:
+        cols = self.cols
+        path = [divmod(current, cols)]
+        while came_from[current] not in (-1, current):
             current = came_from[current]
-            path.append(current)
+            path.append(divmod(current, cols))
         path.reverse()
         return path
+
+
+class DistanceField:
+    """
+    Расстояния до цели от всех клеток лабиринта, посчитанные одним
+    поиском в ширину от цели. Следующий шаг к цели и оставшаяся длина
+    пути из любой клетки - чтение из плоских массивов.
+    """
+
+    def __init__(self, maze, goal):
+        cells = flat_cells(maze)
+        self.cols = cols = len(maze[0])
+        size = len(cells)
+        # -1 - стена или клетка, из которой цель недостижима
+        self.distances = array('l', [-1]) * size
+        self.next_steps = array('l', [-1]) * size
+        self.goal = goal
+
+        if not is_open(cells, cols, goal):
+            return
+        goal_index = goal[0] * cols + goal[1]
+        distances = self.distances
+        next_steps = self.next_steps
+        distances[goal_index] = 0
+        frontier = [goal_index]
+        distance = 0
+        while frontier:
+            distance += 1
+            following = []
+            for current in frontier:
+                for neighbor in open_neighbors(cells, cols, current):
+                    if distances[neighbor] < 0:
+                        distances[neighbor] = distance
+                        next_steps[neighbor] = current
+                        following.append(neighbor)
+            frontier = following
+
+    def distance(self, pos):
+        """Число шагов от pos до цели или None, если цель недостижима."""
+        distance = self.distances[pos[0] * self.cols + pos[1]]
+        return distance if distance >= 0 else None
+
+    def next_step(self, pos):
+        """Следующая клетка кратчайшего пути к цели или None."""
+        following = self.next_steps[pos[0] * self.cols + pos[1]]
+        return divmod(following, self.cols) if following >= 0 else None
+
+    def path(self, pos):
+        """Кратчайший путь от pos до цели включительно или []."""
+        index = pos[0] * self.cols + pos[1]
+        if self.distances[index] < 0:
+            return []
+        path = [pos]
+        next_steps = self.next_steps
+        index = next_steps[index]
+        while index >= 0:
+            path.append(divmod(index, self.cols))
+            index = next_steps[index]
+        return path
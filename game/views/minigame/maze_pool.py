@@ -0,0 +1,100 @@
+import threading
+from collections import OrderedDict, deque
+
+
+class PreparedMaze:
+    """Готовый к игре лабиринт: сетка, расстояния до выхода и картинка."""
+    __slots__ = ('seed', 'maze', 'distance_field', 'solution_length',
+                 'surface')
+
+    def __init__(self, seed, maze, distance_field, solution_length, surface):
+        self.seed = seed
+        self.maze = maze
+        self.distance_field = distance_field
+        self.solution_length = solution_length
+        self.surface = surface
+
+
+class MazePool:
+    """
+    Пул лабиринтов, которые фоновый поток готовит заранее.
+
+    Лабиринты заказываются по зерну, поэтому лабиринт для зерна один и тот
+    же, когда бы поток его ни построил. build(seed) строит PreparedMaze;
+    готовых лабиринтов хранится не больше size, старые вытесняются.
+    """
+
+    def __init__(self, build, size=2):
+        self.build = build
+        self.size = size
+        self._queue = deque()
+        self._ready = OrderedDict()
+        # Зерно, над которым поток работает прямо сейчас
+        self._building = None
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._work, daemon=True,
+                                        name='maze-pool')
+        self._thread.start()
+
+    def request(self, seed):
+        """Ставит лабиринт для seed в очередь на фоновую генерацию."""
+        with self._condition:
+            if (seed in self._ready or seed in self._queue or
+                    seed == self._building):
+                return
+            self._queue.append(seed)
+            self._condition.notify_all()
+
+    def ready(self, seed):
+        """Готов ли уже лабиринт для seed."""
+        with self._condition:
+            return seed in self._ready
+
+    def take(self, seed):
+        """
+        Забирает лабиринт для seed. Если поток еще строит его, ждет;
+        если лабиринт не заказывался, строит его в вызывающем потоке.
+        """
+        with self._condition:
+            while seed not in self._ready:
+                if seed in self._queue or seed == self._building:
+                    self._condition.wait()
+                else:
+                    break
+            else:
+                return self._ready.pop(seed)
+        return self.build(seed)
+
+    def close(self):
+        """Останавливает фоновый поток."""
+        with self._condition:
+            self._closed = True
+            self._queue.clear()
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _work(self):
+        """Цикл фонового потока: генерация заказанных лабиринтов."""
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                seed = self._building = self._queue.popleft()
+
+            try:
+                prepared = self.build(seed)
+            except Exception as e:
+                # Вызывающий поток построит лабиринт сам и увидит ошибку
+                print(f"Ошибка фоновой генерации лабиринта: {e}")
+                prepared = None
+
+            with self._condition:
+                self._building = None
+                if prepared is not None:
+                    self._ready[seed] = prepared
+                while len(self._ready) > self.size:
+                    self._ready.popitem(last=False)
+                self._condition.notify_all()
@@ -1,22 +1,22 @@
+import random
 import pygame
 from ... import constants as C
 from ...services.asset_loader import AssetLoader
-from .maze_generator import MazeGenerator
+from ...services.rng import RandomStreams
+from .maze_generator import MazeGenerator, DistanceField
+from .maze_pool import MazePool, PreparedMaze
 
 
 class MinigameView:
     """Представление для мини-игры 'Лабиринт'."""
 
-    def __init__(self):
+    def __init__(self, rng=None):
+        # Поток случайных чисел rng.maze для генерации лабиринтов
+        self.rng = rng or RandomStreams()
         self.maze = []
         self.rows = C.MINIGAME_ROWS
         self.cols = C.MINIGAME_COLS
-        self.cell_size = C.MINIGAME_CELL_SIZE
-
-        self.width = self.cols * self.cell_size
-        self.height = self.rows * self.cell_size
-        self.x_offset = (C.WINDOW_WIDTH - self.width) / 2
-        self.y_offset = (C.WINDOW_HEIGHT - self.height) / 2
+        self._layout()
 
         self.player_pos = (0, 0)
         self.start_pos = (1, 0)
@@ -24,20 +24,130 @@ class MinigameView:
 
         self.move_timer = 0
         self.active = False
+        # Клетка, в которой игрок нарисован на экране в последний раз
+        self._drawn_player_pos = None
+        # Лабиринт, отрисованный один раз после генерации
+        self.maze_surface = None
+
+        # Подсказка: путь к выходу по расстояниям, посчитанным один раз
+        # для лабиринта, и клетки пути, нарисованные в последний раз
+        self.distance_field = None
+        self.hint_visible = False
+        self._drawn_hint = set()
+        self._hint_rect = None
+
+        # Лабиринты готовятся в фоновом потоке заранее, по зерну из
+        # rng.maze, выбранному в prepare()
+        self.pool = MazePool(self._build_maze, C.MINIGAME_POOL_SIZE)
+        self.next_seed = None
+        self.solution_length = None
 
         self.font = AssetLoader.get_font(C.FONT_SIZE_MEDIUM)
         self.font_small = AssetLoader.get_font(C.FONT_SIZE_SMALL)
+        self.title_surf = AssetLoader.render_text(
+            self.font, "Шанс на возрождение: доберитесь до выхода!",
+            C.COLOR_WHITE)
+        self.instruction_surf = AssetLoader.render_text(
+            self.font_small, "Осторожно: прикосновение к стене = поражение!",
+            C.COLOR_RED)
+
+    @staticmethod
+    def cell_size_for(rows, cols):
+        """
+        Размер клетки лабиринта rows x cols. Клетки уменьшаются,
+        чтобы большой лабиринт поместился под заголовком.
+        """
+        max_width = C.WINDOW_WIDTH - 2 * C.MINIGAME_MAZE_MARGIN
+        max_height = (C.WINDOW_HEIGHT - C.MINIGAME_MAZE_TOP -
+                      C.MINIGAME_MAZE_MARGIN)
+        return max(1, min(C.MINIGAME_CELL_SIZE,
+                          max_width // cols, max_height // rows))
+
+    def _layout(self):
+        """Размер клетки и положение лабиринта на экране."""
+        self.cell_size = self.cell_size_for(self.rows, self.cols)
+        self.width = self.cols * self.cell_size
+        self.height = self.rows * self.cell_size
+        self.x_offset = (C.WINDOW_WIDTH - self.width) / 2
+        self.y_offset = max(C.MINIGAME_MAZE_TOP,
+                            (C.WINDOW_HEIGHT - self.height) / 2)
+
+    def prepare(self):
+        """
+        Выбирает зерно следующего лабиринта и заказывает его фоновому
+        потоку, чтобы start() не генерировал лабиринт сам.
+        """
+        self.next_seed = self.rng.maze.randrange(2 ** 32)
+        self.pool.request(self.next_seed)
 
     def start(self):
-        """Начало новой сессию мини-игры, генерируя новый лабиринт."""
-        generator = MazeGenerator(self.rows, self.cols)
-        self.maze = generator.generate()
+        """Начало новой сессию мини-игры с заранее готовым лабиринтом."""
+        if self.next_seed is None:
+            self.prepare()
+        prepared = self.pool.take(self.next_seed)
+        self.next_seed = None
+
+        self.maze = prepared.maze
+        self.rows = self.maze.rows
+        self.cols = self.maze.cols
+        self._layout()
+        self.end_pos = (self.rows - 2, self.cols - 1)
+        self.maze_surface = prepared.surface
+        self.distance_field = prepared.distance_field
+        self.solution_length = prepared.solution_length
+
         self.player_pos = self.start_pos
         self.active = True
+        self.hint_visible = False
+        self._drawn_player_pos = None
+
+    def _build_maze(self, seed):
+        """
+        Генерация, проверка проходимости и отрисовка лабиринта для seed.
+        Вызывается из фонового потока, поэтому не меняет состояние view.
+        """
+        rng = random.Random(seed)
+        while True:
+            generator = MazeGenerator(C.MINIGAME_ROWS, C.MINIGAME_COLS,
+                                      rng, C.MINIGAME_MAZE_ALGORITHM)
+            maze = generator.generate()
+            # Генератор делает размеры нечетными, поэтому они берутся из него
+            end_pos = (generator.rows - 2, generator.cols - 1)
+            distance_field = DistanceField(maze, end_pos)
+            solution_length = distance_field.distance(self.start_pos)
+            if solution_length is not None:
+                break
+
+        cell_size = self.cell_size_for(maze.rows, maze.cols)
+        return PreparedMaze(seed, maze, distance_field, solution_length,
+                            self._render_maze(maze, cell_size))
+
+    @staticmethod
+    def _render_maze(maze, cell_size):
+        """
+        Отрисовка лабиринта в поверхность: байты сетки становятся
+        палитровой поверхностью по пикселю на клетку, которая затем
+        масштабируется до размера клеток.
+        """
+        surface = pygame.image.frombuffer(maze.cells,
+                                          (maze.cols, maze.rows), 'P')
+        surface.set_palette([C.MINIGAME_PATH_COLOR, C.MINIGAME_WALL_COLOR])
+        return pygame.transform.scale(surface, (maze.cols * cell_size,
+                                                maze.rows * cell_size))
 
     def handle_event(self, event):
         """Обработка ввода для перемещения по лабиринту."""
-        if not self.active or self.move_timer > 0:
+        if not self.active:
+            return None
+
+        if (event.type == pygame.KEYDOWN and
+                event.key == pygame.key.key_code(C.MINIGAME_HINT_KEY)):
+            self.hint_visible = not self.hint_visible
+            # Подсказка появляется или пропадает при полной перерисовке
+            self._drawn_player_pos = None
+            return None
+
+        if self.move_timer > 0:
             return None
 
         if event.type == pygame.KEYDOWN:
@@ -73,47 +183,93 @@ class MinigameView:
         if self.move_timer > 0:
             self.move_timer -= dt
 
-    def draw(self, screen):
-        """Отрисовка лабиринта, игрока и цели."""
+    def draw(self, screen, full=True):
+        """
+        Отрисовка лабиринта, подсказки, игрока и цели. Без full
+        перерисовываются только клетки, которые игрок покинул и занял,
+        и изменившиеся клетки подсказки. Возвращает список изменившихся
+        областей экрана.
+        """
         if not self.active:
-            return
+            return []
 
-        screen.fill(C.COLOR_UI_BG)
+        if full or self._drawn_player_pos is None:
+            self._draw_full(screen)
+            self._drawn_player_pos = self.player_pos
+            return [screen.get_rect()]
+
+        if self.player_pos == self._drawn_player_pos:
+            return []
+
+        hint = self._hint_cells()
+        changed = (hint ^ self._drawn_hint) | {self._drawn_player_pos}
+        changed.discard(self.player_pos)
+        dirty = []
+        for cell in changed:
+            rect = self._cell_rect(*cell)
+            pygame.draw.rect(screen, C.MINIGAME_PATHFIND_COLOR
+                             if cell in hint else C.MINIGAME_PATH_COLOR, rect)
+            dirty.append(rect)
+        self._drawn_hint = hint
 
-        main_title_text = "Шанс на возрождение: доберитесь до выхода!"
-        instruction_text = "Осторожно: прикосновение к стене = поражение!"
-
-        main_title_surf = self.font.render(main_title_text, True,
-                                           C.COLOR_WHITE)
-        instruction_surf = self.font_small.render(instruction_text, True,
-                                                  C.COLOR_RED)
-
-        screen.blit(main_title_surf,
-                    main_title_surf.get_rect(centerx=C.WINDOW_WIDTH/2, y=30))
-        screen.blit(instruction_surf,
-                    instruction_surf.get_rect(centerx=C.WINDOW_WIDTH/2, y=80))
-
-        for r in range(self.rows):
-            for c in range(self.cols):
-                rect = pygame.Rect(self.x_offset + c * self.cell_size,
-                                   self.y_offset + r * self.cell_size,
-                                   self.cell_size, self.cell_size)
-                if self.maze[r][c] == 1:
-                    pygame.draw.rect(screen, C.MINIGAME_WALL_COLOR, rect)
-                else:
-                    pygame.draw.rect(screen, C.MINIGAME_PATH_COLOR, rect)
-
-        end_rect = pygame.Rect(self.x_offset + self.end_pos[1] *
-                               self.cell_size,
-                               self.y_offset + self.end_pos[0] *
-                               self.cell_size,
-                               self.cell_size, self.cell_size)
-        pygame.draw.rect(screen, C.MINIGAME_TARGET_COLOR, end_rect)
-
-        player_r, player_c = self.player_pos
-        player_rect = pygame.Rect(self.x_offset + player_c *
-                                  self.cell_size,
-                                  self.y_offset + player_r *
-                                  self.cell_size,
-                                  self.cell_size, self.cell_size)
+        player_rect = self._cell_rect(*self.player_pos)
         pygame.draw.rect(screen, C.MINIGAME_PLAYER_COLOR, player_rect)
+        dirty.append(player_rect)
+        dirty.append(self._draw_hint_label(screen))
+        self._drawn_player_pos = self.player_pos
+        return dirty
+
+    def _hint_cells(self):
+        """Клетки пути от игрока к выходу, кроме самих игрока и выхода."""
+        if not self.hint_visible:
+            return set()
+        return set(self.distance_field.path(self.player_pos)[1:-1])
+
+    def _draw_hint_label(self, screen):
+        """
+        Подпись подсказки в левом верхнем углу.
+        Возвращает область, которую она занимала и заняла.
+        """
+        if self.hint_visible:
+            distance = self.distance_field.distance(self.player_pos)
+            text = f"До выхода: {distance}"
+        else:
+            text = f"{C.MINIGAME_HINT_KEY.upper()} - подсказка"
+        label = AssetLoader.render_text(self.font_small, text,
+                                        C.COLOR_WHITE)
+
+        dirty = label.get_rect(topleft=(20, 35))
+        if self._hint_rect is not None:
+            screen.fill(C.COLOR_UI_BG, self._hint_rect)
+            dirty.union_ip(self._hint_rect)
+        screen.blit(label, (20, 35))
+        self._hint_rect = label.get_rect(topleft=(20, 35))
+        return dirty
+
+    def _cell_rect(self, r, c):
+        """Область клетки (r, c) на экране."""
+        return pygame.Rect(self.x_offset + c * self.cell_size,
+                           self.y_offset + r * self.cell_size,
+                           self.cell_size, self.cell_size)
+
+    def _draw_full(self, screen):
+        """Отрисовка всего экрана мини-игры."""
+        screen.fill(C.COLOR_UI_BG)
+
+        screen.blit(self.title_surf,
+                    self.title_surf.get_rect(centerx=C.WINDOW_WIDTH/2, y=30))
+        screen.blit(self.instruction_surf,
+                    self.instruction_surf.get_rect(centerx=C.WINDOW_WIDTH/2,
+                                                   y=80))
+        self._hint_rect = None
+        self._draw_hint_label(screen)
+
+        screen.blit(self.maze_surface, (self.x_offset, self.y_offset))
+        self._drawn_hint = self._hint_cells()
+        for cell in self._drawn_hint:
+            pygame.draw.rect(screen, C.MINIGAME_PATHFIND_COLOR,
+                             self._cell_rect(*cell))
+        pygame.draw.rect(screen, C.MINIGAME_TARGET_COLOR,
+                         self._cell_rect(*self.end_pos))
+        pygame.draw.rect(screen, C.MINIGAME_PLAYER_COLOR,
+                         self._cell_rect(*self.player_pos))
@@ -0,0 +1,266 @@
+import argparse
+import json
+import os
+import random
+import time
+
+import pygame
+from game import constants as C
+from game.game_manager import GameManager
+from game.services.asset_loader import AssetLoader
+from game.services.progress_manager import ProgressManager
+from game.services.replay import ReplayReader
+
+
+class ScriptedInput:
+    """Скриптовый ввод для игрока в безоконной симуляции."""
+
+    POLICIES = ('idle', 'random', 'dodge')
+
+    def __init__(self, policy, lookahead=400, change_interval=1.0,
+                 seed=None):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Неизвестная политика ввода '{policy}'")
+        self.policy = policy
+        self.rng = random.Random(seed)
+        self.lookahead = lookahead
+        self.change_interval = change_interval
+        self.timer = 0.0
+
+    def reset(self):
+        self.timer = 0.0
+
+    def step(self, game_manager, dt):
+        """Передает игроку нажатия клавиш для текущего шага симуляции."""
+        player = game_manager.player
+        # Новая команда только после завершения смены полосы
+        if player.x != player.target_x:
+            return
+
+        direction = 0
+        if self.policy == 'random':
+            self.timer -= dt
+            if self.timer <= 0:
+                self.timer = self.change_interval
+                direction = self.rng.choice([-1, 0, 1])
+        elif self.policy == 'dodge':
+            direction = self._dodge_direction(game_manager)
+
+        if direction:
+            key = pygame.K_LEFT if direction < 0 else pygame.K_RIGHT
+            player.handle_input(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+    def _dodge_direction(self, game_manager):
+        """Уходит с полосы, если впереди на ней есть препятствие."""
+        player = game_manager.player
+        lanes = game_manager.lane_centers
+
+        def is_blocked(lane_index):
+            lane_x = lanes[lane_index]
+            for obstacle in game_manager.road.obstacles:
+                if (obstacle.lane_x == lane_x and
+                        obstacle.rect.bottom > player.rect.top -
+                        self.lookahead and
+                        obstacle.rect.top < player.rect.bottom):
+                    return True
+            return False
+
+        current = player.current_lane_index
+        if not is_blocked(current):
+            return 0
+        for direction in (-1, 1):
+            if (0 <= current + direction < len(lanes) and
+                    not is_blocked(current + direction)):
+                return direction
+        return 0
+
+
+class HeadlessRunner:
+    """
+    Прогон заездов без окна, звука и ограничения кадров:
+    симуляция шагает с фиксированным шагом так быстро, как позволяет CPU.
+    """
+
+    def __init__(self, policy='dodge', max_run_time=600.0, seed=None):
+        self.game_manager = create_game_manager(
+            ProgressManager(persistent=False), seed)
+        self.input = ScriptedInput(policy, seed=seed)
+        self.max_run_time = max_run_time
+
+    def run_once(self, order_index, route_type):
+        """Проигрывает один заезд и возвращает его результат."""
+        game_manager = self.game_manager
+        order_manager = game_manager.order_manager
+        order_manager.select_order(order_index)
+        order_manager.select_route(route_type)
+        order = order_manager.selected_order
+
+        game_manager.start_new_game()
+        self.input.reset()
+
+        sim_time = 0.0
+        collisions = 0
+        lives = game_manager.player.lives
+        while (game_manager.game_state == C.GameState.PLAYING and
+               sim_time < self.max_run_time):
+            self.input.step(game_manager, C.SIMULATION_DT)
+            game_manager.update(C.SIMULATION_DT)
+            sim_time += C.SIMULATION_DT
+
+            if game_manager.player.lives < lives:
+                collisions += lives - game_manager.player.lives
+            lives = game_manager.player.lives
+
+        if game_manager.game_state == C.GameState.DELIVERY_ANIMATION:
+            outcome = 'delivered'
+        elif game_manager.game_state == C.GameState.PLAYING:
+            outcome = 'timeout'
+        else:
+            outcome = 'failed'
+
+        # Возврат в меню для следующего заезда; в историю заезд попадает
+        # с тем же исходом, брошенным считается только прерванный
+        game_manager.finish_run('abandoned' if outcome == 'timeout'
+                                else outcome)
+        game_manager.game_state = C.GameState.MENU
+        game_manager.menu_view._set_state('main')
+
+        return {
+            'seed': game_manager.run_seed,
+            'order': order.name,
+            'route': route_type,
+            'outcome': outcome,
+            'distance': int(game_manager.road.distance_traveled),
+            'target_distance': game_manager.current_order_distance,
+            'reward': game_manager.current_order_reward,
+            'collisions': collisions,
+            'sim_time': round(sim_time, 3),
+        }
+
+
+def create_game_manager(progress_manager, seed):
+    """
+    Инициализирует pygame без звука и создает GameManager. Чтобы окно
+    не появлялось, SDL_VIDEODRIVER=dummy задается до вызова.
+    """
+    pygame.init()
+    AssetLoader.initialize(audio=False)
+    screen = pygame.display.set_mode((C.WINDOW_WIDTH, C.WINDOW_HEIGHT))
+    return GameManager(screen, pygame.time.Clock(),
+                       progress_manager=progress_manager, seed=seed)
+
+
+def replay(path):
+    """
+    Воспроизводит запись ввода с максимальной скоростью.
+    Возвращает число шагов симуляции и затраченное время.
+    """
+    reader = ReplayReader(path)
+    progress_manager = ProgressManager(persistent=False)
+    progress_manager.apply_snapshot(reader.progress_snapshot)
+    game_manager = create_game_manager(progress_manager, reader.seed)
+    game_manager.replay = reader
+
+    start = time.perf_counter()
+    while game_manager.running:
+        game_manager.feed_replay()
+        if not game_manager.running:
+            break
+        game_manager.update(C.SIMULATION_DT)
+    elapsed = time.perf_counter() - start
+
+    print(f"Воспроизведено шагов: {game_manager.tick} "
+          f"({game_manager.tick * C.SIMULATION_DT:.1f} c игры) "
+          f"за {elapsed:.2f} c, состояние: {game_manager.game_state}, "
+          f"монеты: {game_manager.progress_manager.coins}")
+    pygame.quit()
+    return game_manager
+
+
+def _apply_overrides(overrides):
+    """Переопределяет константы игры из аргументов вида ИМЯ=ЗНАЧЕНИЕ."""
+    for override in overrides:
+        name, _, raw_value = override.partition('=')
+        if not hasattr(C, name):
+            raise SystemExit(f"Неизвестная константа '{name}'")
+        try:
+            value = json.loads(raw_value)
+        except json.JSONDecodeError:
+            value = raw_value
+        setattr(C, name, value)
+
+
+def main(argv=None):
+    """Точка входа безоконной симуляции."""
+    parser = argparse.ArgumentParser(
+        description="Безоконная симуляция заездов Food Rush.")
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--route', choices=['short', 'long', 'both'],
+                        default='both')
+    parser.add_argument('--order', type=int, default=None,
+                        help="индекс заказа; по умолчанию по очереди")
+    parser.add_argument('--policy', choices=ScriptedInput.POLICIES,
+                        default='dodge')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--max-run-time', type=float, default=600.0,
+                        help="предел времени одного заезда, сек симуляции")
+    parser.add_argument('--set', dest='overrides', action='append',
+                        default=[], metavar='NAME=VALUE',
+                        help="переопределить константу, например "
+                             "OBSTACLE_SPAWN_RATE=1.5")
+    parser.add_argument('--json', dest='json_path', default=None,
+                        help="сохранить результаты в JSON-файл")
+    parser.add_argument('--replay', default=None, metavar='PATH',
+                        help="воспроизвести запись ввода вместо заездов")
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args(argv)
+
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+    _apply_overrides(args.overrides)
+    if args.replay:
+        replay(args.replay)
+        return []
+
+    runner = HeadlessRunner(args.policy, args.max_run_time, args.seed)
+    routes = (['short', 'long'] if args.route == 'both' else [args.route])
+
+    results = []
+    start = time.perf_counter()
+    for i in range(args.runs):
+        order_count = len(runner.game_manager.order_manager.available_orders)
+        order_index = args.order if args.order is not None else i % order_count
+        result = runner.run_once(order_index, routes[i % len(routes)])
+        results.append(result)
+        if not args.quiet:
+            print(f"#{i + 1}: {result['outcome']:<9} {result['route']:<5} "
+                  f"{result['distance']}/{result['target_distance']} "
+                  f"столкновений: {result['collisions']} "
+                  f"время: {result['sim_time']:.1f} c")
+    elapsed = time.perf_counter() - start
+    pygame.quit()
+
+    sim_time = sum(result['sim_time'] for result in results)
+    delivered = sum(result['outcome'] == 'delivered' for result in results)
+    summary = {
+        'runs': len(results),
+        'delivered': delivered,
+        'wall_time': round(elapsed, 3),
+        'runs_per_second': round(len(results) / elapsed, 3),
+        'speedup': round(sim_time / elapsed, 1),
+    }
+    print(f"Заездов: {summary['runs']}, доставлено: {delivered}, "
+          f"{summary['runs_per_second']} заездов/с, "
+          f"x{summary['speedup']} быстрее реального времени")
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump({'summary': summary, 'runs': results}, f, indent=4,
+                      ensure_ascii=False)
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,39 @@
+import argparse
+import sys
 import pygame
 from game.game_manager import GameManager
-from game.constants import WINDOW_WIDTH, WINDOW_HEIGHT, GAME_TITLE
+from game.constants import WINDOW_WIDTH, WINDOW_HEIGHT, GAME_TITLE, FPS
 from game.services.asset_loader import AssetLoader
+from game.services.asset_preloader import AssetPreloader
+from game.services.progress_manager import ProgressManager
+from game.services.replay import ReplayFormat, ReplayRecorder, ReplayReader
+from game.services.profiler import Profiler
+from game.views.loading_view import LoadingView
 
 
 def main():
     """Главная функция для запуска игры."""
+    if '--headless' in sys.argv[1:]:
+        from headless import main as headless_main
+        argv = [arg for arg in sys.argv[1:] if arg != '--headless']
+        headless_main(argv)
+        return
+
+    parser = argparse.ArgumentParser(description=GAME_TITLE)
+    parser.add_argument('--seed', type=seed_value, default=None,
+                        help="зерно случайных чисел для воспроизводимых "
+                             "заездов")
+    parser.add_argument('--record', default=None, metavar='PATH',
+                        help="записывать ввод в файл")
+    parser.add_argument('--replay', default=None, metavar='PATH',
+                        help="воспроизвести запись ввода в реальном времени")
+    parser.add_argument('--profile-log', default=None, metavar='PATH',
+                        help="записывать замеры каждого кадра "
+                             "в .csv или .jsonl")
+    parser.add_argument('--asset-report', action='store_true',
+                        help="вывести время загрузки каждого ресурса")
+    args = parser.parse_args()
+
     pygame.init()
 
     AssetLoader.initialize()
@@ -14,12 +42,73 @@ def main():
     pygame.display.set_caption(GAME_TITLE)
 
     clock = pygame.time.Clock()
-    game_manager = GameManager(screen, clock)
+    if not preload_assets(screen, clock, args.asset_report):
+        pygame.quit()
+        return
+
+    if args.replay:
+        reader = ReplayReader(args.replay)
+        progress_manager = ProgressManager(persistent=False)
+        progress_manager.apply_snapshot(reader.progress_snapshot)
+        game_manager = GameManager(screen, clock, progress_manager,
+                                   seed=reader.seed)
+        game_manager.replay = reader
+    else:
+        game_manager = GameManager(screen, clock, seed=args.seed)
+
+    if args.record:
+        game_manager.recorder = ReplayRecorder(
+            args.record, game_manager.seed,
+            game_manager.progress_manager.snapshot())
+
+    if args.profile_log:
+        Profiler.open_log(args.profile_log)
 
     game_manager.run()
 
+    game_manager.progress_manager.close()
+    game_manager.abandon_run()
+    game_manager.run_history.close()
+    Profiler.close_log()
+    if game_manager.recorder:
+        game_manager.recorder.close(game_manager.tick)
+
     pygame.quit()
 
 
+def seed_value(value):
+    """Зерно из командной строки: целое, которое помещается в запись."""
+    try:
+        seed = int(value)
+    except ValueError:
+        seed = None
+    if seed is None or not 0 <= seed <= ReplayFormat.MAX_SEED:
+        raise argparse.ArgumentTypeError(
+            f"зерно должно быть целым от 0 до {ReplayFormat.MAX_SEED}")
+    return seed
+
+
+def preload_assets(screen, clock, full_report=False):
+    """
+    Загрузка всех ресурсов до появления меню с экраном загрузки.
+    Возвращает False, если окно закрыли во время загрузки.
+    """
+    preloader = AssetPreloader()
+    loading_view = LoadingView()
+    while not preloader.done:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                preloader.cancel()
+                return False
+        preloader.poll()
+        loading_view.draw(screen, preloader.progress)
+        pygame.display.flip()
+        clock.tick(FPS)
+
+    report = preloader.report()
+    print('\n'.join(report if full_report else report[:1]))
+    return True
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,17 @@
+import os
+import sys
+
+import pytest
+
+# Тесты идут без окна и звука
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(autouse=True)
+def _root_cwd(monkeypatch):
+    """Ресурсы игры ищутся относительно корня репозитория."""
+    monkeypatch.chdir(ROOT)
@@ -0,0 +1,44 @@
+import pytest
+
+from game import constants as C
+from game.services.progress_manager import ProgressManager
+from headless import create_game_manager
+
+
+@pytest.fixture
+def game_manager():
+    return create_game_manager(ProgressManager(persistent=False), seed=0)
+
+
+def test_abandoned_run_keeps_its_order_and_route(game_manager):
+    order_manager = game_manager.order_manager
+    order_manager.select_order(0)
+    order_manager.select_route('short')
+    first_order = order_manager.selected_order.name
+    first_target = order_manager.get_final_parameters()[0]
+    game_manager.start_new_game()
+    for _ in range(10):
+        game_manager.update(C.SIMULATION_DT)
+
+    # Возврат в меню и выбор другого заказа
+    game_manager.game_state = C.GameState.MENU
+    order_manager.select_order(1)
+    order_manager.select_route('long')
+    game_manager.start_new_game()
+
+    [run] = game_manager.run_history.recent()
+    assert run['outcome'] == 'abandoned'
+    assert run['order_name'] == first_order
+    assert run['route'] == 'short'
+    assert run['target_distance'] == first_target
+    assert run['order_name'] != order_manager.selected_order.name
+
+
+def test_run_is_recorded_once(game_manager):
+    game_manager.order_manager.select_order(0)
+    game_manager.order_manager.select_route('short')
+    game_manager.start_new_game()
+    game_manager.abandon_run()
+    game_manager.abandon_run()
+
+    assert game_manager.run_history.totals()['abandoned']['runs'] == 1